@@ -0,0 +1,63 @@
+"""
+Async Bulk File Benchmark
+=========================
+
+Compares sequential FileHandler loops with AsyncFileHandler's read_many,
+stat_many and copy_many on a directory of small files.
+
+Run from day4/morning:
+    python benchmarks/bench_async_files.py [files] [workers]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.async_file_handler import AsyncFileHandler
+from mypackage.file_handler import FileHandler
+
+def timed(func):
+    """Run func once and return seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(files=2000, workers=16):
+    """Time each operation both ways"""
+    handler = FileHandler()
+    with tempfile.TemporaryDirectory() as directory:
+        sources = []
+        for i in range(files):
+            path = os.path.join(directory, f"file{i}.txt")
+            handler.write_text_file(path, f"record {i}\n" * 200)
+            sources.append(path)
+        pairs = [(path, path + '.copy') for path in sources]
+
+        async_handler = AsyncFileHandler(max_workers=workers)
+        cases = [
+            ('read', lambda: [handler.read_text_file(p) for p in sources],
+             lambda: asyncio.run(async_handler.read_many(sources))),
+            ('stat', lambda: [os.stat(p) for p in sources],
+             lambda: asyncio.run(async_handler.stat_many(sources))),
+            ('copy', lambda: [handler.copy_file(s, d) for s, d in pairs],
+             lambda: asyncio.run(async_handler.copy_many(pairs))),
+        ]
+
+        print("ASYNC BULK FILE OPERATIONS")
+        print("=" * 56)
+        print(f"Files: {files}, workers: {workers}")
+        print(f"{'operation':<12}{'sequential':>14}{'async bulk':>14}{'speedup':>12}")
+        for name, sequential, bulk in cases:
+            serial_time = timed(sequential)
+            bulk_time = timed(bulk)
+            print(f"{name:<12}{serial_time:>13.3f}s{bulk_time:>13.3f}s{serial_time / bulk_time:>11.2f}x")
+        async_handler.close()
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
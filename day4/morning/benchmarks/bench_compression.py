@@ -0,0 +1,59 @@
+"""
+Compression Benchmark
+=====================
+
+Write time, read time and file size of the same CSV data written through
+FileHandler as plain text, gzip, bz2, xz and (if installed) zstd, plus
+parallel block compression for gzip.
+
+Run from day4/morning:
+    python benchmarks/bench_compression.py [rows] [workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage import compression
+from mypackage.file_handler import FileHandler
+from mypackage.utils import format_bytes
+
+def rows(count):
+    """Synthetic, fairly compressible rows"""
+    for i in range(count):
+        yield (i, f"customer-{i % 5000}", f"{i % 97 * 1.25:.2f}", "2024-01-01", "ok")
+
+def timed(func):
+    """Run func once and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def run(count=300000, workers=4):
+    """Write and read the same data in every format"""
+    fieldnames = ['id', 'name', 'amount', 'date', 'status']
+    cases = [('plain', '.csv', None), ('gzip', '.csv.gz', None), ('bz2', '.csv.bz2', None),
+             ('xz', '.csv.xz', None), (f'gzip x{workers}', '.csv.gz', workers)]
+    if compression.zstandard is not None:
+        cases.insert(4, ('zstd', '.csv.zst', None))
+
+    print("COMPRESSED CSV I/O")
+    print("=" * 60)
+    print(f"Rows: {count}")
+    print(f"{'format':<12}{'write':>10}{'read':>10}{'size':>16}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, suffix, parallel in cases:
+            handler = FileHandler(compression_workers=parallel)
+            path = os.path.join(directory, f"data{suffix}")
+            _, write_time = timed(lambda: handler.write_csv_stream(path, rows(count), fieldnames))
+            _, read_time = timed(lambda: sum(1 for _ in handler.iter_csv(path)))
+            size = format_bytes(os.path.getsize(path))
+            print(f"{name:<12}{write_time:>9.2f}s{read_time:>9.2f}s{size:>16}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
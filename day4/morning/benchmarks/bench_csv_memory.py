@@ -0,0 +1,85 @@
+"""
+CSV Memory Benchmark
+====================
+
+Peak resident memory of FileHandler.read_csv_file versus iter_csv.
+Each reader runs in its own subprocess so the peaks do not mix.
+
+Run from day4/morning:
+    python benchmarks/bench_csv_memory.py [size_mb]
+    python benchmarks/bench_csv_memory.py 10240   # the 10 GB case
+
+The generated file is written to the system temp directory and removed
+afterwards. read_csv_file is skipped above 1 GB since it would need many
+times the file size in RAM.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.file_handler import FileHandler
+
+READERS = {
+    'read_csv_file': "rows = handler.read_csv_file(path); total = len(rows)",
+    'iter_csv': "total = sum(1 for _ in handler.iter_csv(path))",
+    'iter_csv tuples': "total = sum(1 for _ in handler.iter_csv(path, as_tuples=True))",
+}
+
+CHILD = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+from mypackage.file_handler import FileHandler
+handler = FileHandler()
+path = {path!r}
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(total, elapsed, peak_kb)
+"""
+
+def make_csv(path, size_mb):
+    """Write a synthetic CSV of roughly size_mb megabytes"""
+    target = size_mb * 1024 * 1024
+    handler = FileHandler()
+
+    def rows():
+        written = 0
+        index = 0
+        while written < target:
+            row = (index, f"customer-{index}", index % 97 * 1.25, "2024-01-01")
+            written += 40
+            index += 1
+            yield row
+
+    handler.write_csv_stream(path, rows(), ['id', 'name', 'amount', 'date'])
+
+def run(size_mb=100):
+    """Measure each reader on the same file"""
+    root = os.path.dirname(HERE)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.csv')
+        make_csv(path, size_mb)
+        actual_mb = os.path.getsize(path) / 1024 / 1024
+
+        print("CSV MEMORY BENCHMARK")
+        print("=" * 60)
+        print(f"File: {actual_mb:.1f} MB")
+        print(f"{'reader':<20}{'rows':>12}{'seconds':>10}{'peak RSS':>14}")
+        for name, statement in READERS.items():
+            if name == 'read_csv_file' and size_mb > 1024:
+                print(f"{name:<20}{'skipped':>12}")
+                continue
+            code = CHILD.format(root=root, path=path, statement=statement)
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                    text=True, check=True).stdout.split()
+            total, elapsed, peak_kb = int(output[-3]), float(output[-2]), int(output[-1])
+            print(f"{name:<20}{total:>12}{elapsed:>10.2f}{peak_kb / 1024:>11.1f} MB")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,66 @@
+"""
+Date Arithmetic Benchmark
+=========================
+
+Rows per second for add_days/days_between called once per row compared
+with the batch add_days_many/days_between_many, whose parse cache makes
+repeated date strings cheap. The numpy array path is timed when numpy
+is installed.
+
+Run from day4/morning:
+    python benchmarks/bench_dates.py [rows] [distinct_dates]
+"""
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.utils import add_days, add_days_many, days_between, days_between_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def timed(func):
+    """Run func once and return seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def make_dates(rows, distinct):
+    """rows ISO dates drawn from `distinct` consecutive days, 1% invalid"""
+    first = date(2020, 1, 1)
+    values = [(first + timedelta(days=index % distinct)).isoformat() for index in range(rows)]
+    for index in range(0, rows, 100):
+        values[index] = 'not a date'
+    return values
+
+def run(rows=1000000, distinct=365):
+    """Time per-row and batch date arithmetic on `rows` dates"""
+    starts = make_dates(rows, distinct)
+    ends = starts[::-1]
+    cases = [
+        ('add_days per row', timed(lambda: [add_days(value, 30) for value in starts])),
+        ('add_days_many', timed(lambda: add_days_many(starts, 30))),
+        ('days_between per row', timed(lambda: [days_between(a, b) for a, b in zip(starts, ends)])),
+        ('days_between_many', timed(lambda: days_between_many(starts, ends))),
+    ]
+    if numpy is not None:
+        cases += [
+            ('add_days_many as_array', timed(lambda: add_days_many(starts, 30, as_array=True))),
+            ('days_between_many as_array', timed(lambda: days_between_many(starts, ends, as_array=True))),
+        ]
+    print("DATE ARITHMETIC THROUGHPUT")
+    print("=" * 62)
+    print(f"Rows: {rows}, distinct dates: {distinct}, numpy: {'yes' if numpy else 'no'}")
+    for name, seconds in cases:
+        print(f"{name:<32}{seconds:>9.2f}s{rows / seconds:>15,.0f} rows/s")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,74 @@
+"""
+Flatten and Chunk Benchmark
+===========================
+
+Times the iterative flatten_list against the previous recursive version
+on wide (many shallow sublists) and deep (one long chain) inputs, and
+chunking a list, a generator and a bytes buffer (memoryview chunks).
+
+Run from day4/morning:
+    python benchmarks/bench_flatten_chunks.py [items] [depth]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.utils import chunk_list, flatten_list, iter_chunks, iter_memory_chunks
+
+def recursive_flatten(nested_list):
+    """The previous recursive flatten_list, for comparison"""
+    flattened = []
+    for item in nested_list:
+        if isinstance(item, list):
+            flattened.extend(recursive_flatten(item))
+        else:
+            flattened.append(item)
+    return flattened
+
+def timed(func):
+    """Run func once and return seconds, or None if it overflowed the stack"""
+    start = time.perf_counter()
+    try:
+        func()
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+def make_deep(depth):
+    """[0, [1, [2, ...]]] nested depth levels"""
+    root = current = []
+    for level in range(depth):
+        child = [level]
+        current.append(child)
+        current = child
+    return root
+
+def run(items=1000000, depth=100000):
+    """Time flattening and chunking"""
+    wide = [[index, index + 1, [index + 2]] for index in range(0, items, 3)]
+    deep = make_deep(depth)
+    buffer = bytes(items)
+    cases = [
+        ('wide: recursive flatten', timed(lambda: recursive_flatten(wide))),
+        ('wide: flatten_list', timed(lambda: flatten_list(wide))),
+        (f'deep ({depth}): recursive flatten', timed(lambda: recursive_flatten(deep))),
+        (f'deep ({depth}): flatten_list', timed(lambda: flatten_list(deep))),
+        ('chunk_list(list, 100)', timed(lambda: chunk_list(list(range(items)), 100))),
+        ('iter_chunks(generator, 100)', timed(lambda: sum(1 for _ in iter_chunks(iter(range(items)), 100)))),
+        ('bytes slices, 4096', timed(lambda: [buffer[i:i + 4096] for i in range(0, items, 4096)])),
+        ('iter_memory_chunks, 4096', timed(lambda: list(iter_memory_chunks(buffer, 4096)))),
+    ]
+    print("FLATTEN AND CHUNK")
+    print("=" * 55)
+    print(f"Items: {items}")
+    for name, seconds in cases:
+        result = f"{seconds * 1000:>10.2f} ms" if seconds is not None else "RecursionError".rjust(15)
+        print(f"{name:<40}{result}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
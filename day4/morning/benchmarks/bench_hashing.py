@@ -0,0 +1,60 @@
+"""
+Hashing Throughput Benchmark
+============================
+
+MB/s of utils.hash_file for every available algorithm (buffered reads
+and mmap), and of hash_many over a set of files with 1 to 8 threads.
+
+Run from day4/morning:
+    python benchmarks/bench_hashing.py [file_mb] [files]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.utils import HASH_ALGORITHMS, hash_file, hash_many
+
+def timed(func):
+    """Run func once and return seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(file_mb=64, files=16):
+    """Hash one large file per algorithm, then many files in parallel"""
+    with tempfile.TemporaryDirectory() as directory:
+        big = os.path.join(directory, 'big.bin')
+        with open(big, 'wb') as file:
+            for _ in range(file_mb):
+                file.write(os.urandom(1024 * 1024))
+
+        print("HASHING THROUGHPUT")
+        print("=" * 52)
+        print(f"{'algorithm':<12}{'buffered MB/s':>18}{'mmap MB/s':>18}")
+        for algorithm in HASH_ALGORITHMS:
+            buffered = timed(lambda: hash_file(big, algorithm))
+            mapped = timed(lambda: hash_file(big, algorithm, use_mmap=True))
+            print(f"{algorithm:<12}{file_mb / buffered:>18.1f}{file_mb / mapped:>18.1f}")
+
+        per_file_mb = max(1, file_mb // files)
+        paths = []
+        for i in range(files):
+            path = os.path.join(directory, f"part{i}.bin")
+            with open(path, 'wb') as file:
+                file.write(os.urandom(per_file_mb * 1024 * 1024))
+            paths.append(path)
+
+        total_mb = per_file_mb * files
+        print(f"\nhash_many sha256 over {files} x {per_file_mb} MB files")
+        for workers in (1, 2, 4, 8):
+            seconds = timed(lambda: hash_many(paths, 'sha256', workers=workers))
+            print(f"{'workers=' + str(workers):<12}{total_mb / seconds:>18.1f} MB/s")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
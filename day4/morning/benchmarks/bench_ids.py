@@ -0,0 +1,47 @@
+"""
+Random Id Throughput Benchmark
+==============================
+
+Ids per second from generate_ids (bulk os.urandom + translate) compared
+with the per-character random.choice approach used by
+generate_random_string.
+
+Run from day4/morning:
+    python benchmarks/bench_ids.py [count] [length]
+    python benchmarks/bench_ids.py 10000000   # the 10M case
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.utils import generate_ids, generate_random_string
+
+def timed(func):
+    """Run func once and return seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(count=1000000, length=16):
+    """Time each generator for `count` ids"""
+    # random.choice is slow, so measure it on a sample and extrapolate
+    sample = min(count, 100000)
+    per_char_seconds = timed(lambda: [generate_random_string(length) for _ in range(sample)])
+    cases = [
+        ('random.choice per char (sampled)', per_char_seconds * count / sample),
+        ('generate_ids unique=False', timed(lambda: generate_ids(count, length, unique=False))),
+        ('generate_ids unique=True', timed(lambda: generate_ids(count, length, unique=True))),
+    ]
+    print("RANDOM ID THROUGHPUT")
+    print("=" * 62)
+    print(f"Ids: {count}, length: {length}")
+    for name, seconds in cases:
+        print(f"{name:<36}{seconds:>9.2f}s{count / seconds:>13,.0f} ids/s")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
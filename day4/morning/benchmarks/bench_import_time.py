@@ -0,0 +1,58 @@
+"""
+Import Time Benchmark
+=====================
+
+Uses `python -X importtime` to measure cold-start cost of the lazy
+mypackage __init__ against importing every submodule eagerly (what the
+package used to do on `import mypackage`).
+
+Run from day4/morning:
+    python benchmarks/bench_import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'import mypackage': "import mypackage",
+    'from mypackage import quick_math': "from mypackage import quick_math",
+    'eager (all submodules)': (
+        "import mypackage.calculator, mypackage.text_processor, "
+        "mypackage.file_handler, mypackage.utils"
+    ),
+}
+
+def import_time_us(statement):
+    """Total microseconds -X importtime attributes to the statement's imports"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    baseline = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+
+    def top_level_total(stderr):
+        # Lines look like "import time:   self [us] | cumulative | <indent>name";
+        # top-level imports have no indentation before the name
+        total = 0
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not name[1:].startswith(' '):
+                total += int(cumulative)
+        return total
+
+    return top_level_total(result.stderr) - top_level_total(baseline.stderr)
+
+def run(runs=5):
+    """Report the best of `runs` for every scenario"""
+    print("IMPORT TIME (-X importtime, best of runs)")
+    print("=" * 56)
+    for name, statement in SCENARIOS.items():
+        best = min(import_time_us(statement) for _ in range(runs))
+        print(f"{name:<40}{best / 1000:>10.2f} ms")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
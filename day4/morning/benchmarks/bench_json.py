@@ -0,0 +1,69 @@
+"""
+JSON Throughput Benchmark
+=========================
+
+MB/s for FileHandler's JSON readers and writers: pretty vs compact
+write_json_file, write_jsonl, read_json_file, iter_json_array and
+iter_jsonl. The encoder backend (orjson or the json module) is reported.
+
+Run from day4/morning:
+    python benchmarks/bench_json.py [records]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage import file_handler
+from mypackage.file_handler import FileHandler
+
+def make_records(count):
+    """Synthetic event records"""
+    return [
+        {'id': i, 'user': f"user{i % 1000}", 'amount': i * 0.37, 'tags': ['a', 'b'], 'ok': i % 3 == 0}
+        for i in range(count)
+    ]
+
+def timed(func):
+    """Run func once and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def run(records=200000):
+    """Time every JSON path on the same data"""
+    data = make_records(records)
+    handler = FileHandler()
+    backend = 'orjson' if file_handler.orjson is not None else 'json (stdlib)'
+
+    print("JSON THROUGHPUT")
+    print("=" * 60)
+    print(f"Records: {records}, compact encoder: {backend}")
+    print(f"{'operation':<32}{'size':>10}{'MB/s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        pretty = os.path.join(directory, 'pretty.json')
+        compact = os.path.join(directory, 'compact.json')
+        lines = os.path.join(directory, 'data.jsonl')
+
+        writes = [
+            ('write_json_file (indent=2)', pretty, lambda: handler.write_json_file(pretty, data)),
+            ('write_json_file (compact)', compact, lambda: handler.write_json_file(compact, data, compact=True)),
+            ('write_jsonl', lines, lambda: handler.write_jsonl(lines, data)),
+        ]
+        reads = [
+            ('read_json_file (pretty)', pretty, lambda: handler.read_json_file(pretty)),
+            ('read_json_file (compact)', compact, lambda: handler.read_json_file(compact)),
+            ('iter_json_array (compact)', compact, lambda: sum(1 for _ in handler.iter_json_array(compact))),
+            ('iter_jsonl', lines, lambda: sum(1 for _ in handler.iter_jsonl(lines))),
+        ]
+        for name, path, func in writes + reads:
+            _, seconds = timed(func)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            print(f"{name:<32}{size_mb:>8.1f}MB{size_mb / seconds:>10.1f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,90 @@
+"""
+Multi-Pattern Replace Benchmark
+===============================
+
+Compares looping TextProcessor.replace_text over a dictionary with a
+single TextProcessor.replace_many pass, and the per-document cost of a
+short text with a cached dict versus a prebuilt Replacer.
+
+Run from day4/morning:
+    python benchmarks/bench_replace_many.py [patterns] [text_kb]
+"""
+
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.text_processor import TextProcessor
+
+def make_mapping(size, seed=1):
+    """Build `size` distinct redaction rules"""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    mapping = {}
+    while len(mapping) < size:
+        word = ''.join(rng.choices(letters, k=rng.randint(5, 10)))
+        mapping[word] = '[REDACTED]'
+    return mapping
+
+def make_text(mapping, size_kb, seed=2):
+    """Text mixing filler words with a sprinkling of mapped words"""
+    rng = random.Random(seed)
+    keys = list(mapping)
+    words = []
+    length = 0
+    while length < size_kb * 1024:
+        word = rng.choice(keys) if rng.random() < 0.1 else 'filler'
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+def run(patterns=50000, text_kb=64):
+    """Time both approaches on the same text and mapping"""
+    mapping = make_mapping(patterns)
+    text = make_text(mapping, text_kb)
+    processor = TextProcessor()
+
+    print("MULTI-PATTERN REPLACE")
+    print("=" * 60)
+    print(f"Patterns: {patterns}, text: {text_kb} KB")
+
+    start = time.perf_counter()
+    looped = text
+    for old, new in mapping.items():
+        looped = processor.replace_text(looped, old, new)
+    loop_time = time.perf_counter() - start
+    print(f"{'replace_text loop':<28}{loop_time:>10.3f}s")
+
+    start = time.perf_counter()
+    processor.replace_many(text, mapping)
+    first_time = time.perf_counter() - start
+    print(f"{'replace_many (build + run)':<28}{first_time:>10.3f}s")
+
+    start = time.perf_counter()
+    result = processor.replace_many(text, mapping)
+    cached_time = time.perf_counter() - start
+    print(f"{'replace_many (cached)':<28}{cached_time:>10.3f}s")
+
+    replacer = processor.build_replacer(mapping)
+    document = text[:200]
+    for label, target in (('replace_many short doc (dict)', mapping),
+                          ('replace_many short doc (Replacer)', replacer)):
+        repeat = 200
+        start = time.perf_counter()
+        for _ in range(repeat):
+            processor.replace_many(document, target)
+        per_call = (time.perf_counter() - start) / repeat
+        print(f"{label:<34}{per_call * 1000:>8.3f}ms")
+    assert replacer.replace(text) == result
+
+    # Sequential replace_text can re-match inside earlier output, so only
+    # compare the redaction counts, not the exact strings
+    print(f"Redactions: loop {looped.count('[REDACTED]')}, one pass {result.count('[REDACTED]')}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
@@ -0,0 +1,215 @@
+"""
+Startup Benchmark Harness
+=========================
+
+Tracks cold-start regressions for mypackage and modules_example. Every
+measurement runs in a fresh interpreter; timings report the fastest of
+the runs (the least disturbed by other load), memory the median:
+
+- import time of each module
+- first-call latency of each public API (import excluded)
+- resident memory after importing each module (total and growth)
+
+Run from day4/morning:
+    python benchmarks/bench_startup.py                      # table
+    python benchmarks/bench_startup.py --json out.json      # machine-readable
+    python benchmarks/bench_startup.py --save-baseline base.json
+    python benchmarks/bench_startup.py --compare base.json --threshold 20
+
+With --compare the exit status is 1 if any metric got more than
+--threshold percent worse than the baseline and also worse by more than a
+noise floor. The floor is the larger of an absolute minimum (--min-ms for
+timings, --min-kb for memory) and --noise-factor times the run-to-run
+spread measured for that metric (median minus best for timings, max minus
+min for memory), taken from whichever of the two runs was noisier.
+Baselines store the spread next to the values. First calls take only
+microseconds, so they use more runs (--first-call-runs).
+
+Every interpreter also times a fixed CPU workload. When comparing, each
+timing is scaled by the baseline's calibration time over the current one,
+so a machine that is slower as a whole (throttling, other load) is not
+reported as a regression. The 'current' column shows scaled timings.
+"""
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES_EXAMPLE = os.path.join(ROOT, 'modules_example')
+
+MODULES = [
+    'mypackage',
+    'mypackage.calculator',
+    'mypackage.text_processor',
+    'mypackage.file_handler',
+    'mypackage.utils',
+    'math_utils',
+    'string_utils',
+]
+
+# name -> (setup import, first call)
+FIRST_CALLS = {
+    'Calculator': ("from mypackage import Calculator", "Calculator().add(1, 2)"),
+    'TextProcessor': ("from mypackage import TextProcessor",
+                      "TextProcessor().get_text_stats('Hello world. Again!')"),
+    'FileHandler': ("from mypackage import FileHandler", "FileHandler().file_exists(__file__)"),
+    'quick_math': ("from mypackage import quick_math", "quick_math('add', 1, 2)"),
+    'quick_text': ("from mypackage import quick_text", "quick_text('upper', 'hello')"),
+}
+
+CHILD = """
+import json, sys, time
+sys.path[:0] = [{root!r}, {examples!r}]
+__file__ = {root!r}
+
+def rss_kb():
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * {page_kb}
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+rss_before = rss_kb()
+start = time.perf_counter()
+{setup}
+import_seconds = time.perf_counter() - start
+rss_after = rss_kb()
+start = time.perf_counter()
+{call}
+call_seconds = time.perf_counter() - start
+# Fixed CPU workload, timed after the measurements so it cannot affect them
+start = time.perf_counter()
+sum(i * i for i in range(200000))
+calibration_seconds = time.perf_counter() - start
+print(json.dumps({{'import_ms': import_seconds * 1000, 'call_ms': call_seconds * 1000,
+                  'calibration_ms': calibration_seconds * 1000,
+                  'rss_kb': rss_after, 'rss_delta_kb': rss_after - rss_before}}))
+"""
+
+def measure(setup, call='pass', runs=9):
+    """Best timings and median memory of `runs` fresh interpreters, plus spreads"""
+    page_kb = os.sysconf('SC_PAGE_SIZE') // 1024 if hasattr(os, 'sysconf') else 4
+    code = CHILD.format(root=ROOT, examples=MODULES_EXAMPLE, page_kb=page_kb,
+                        setup=setup, call=call)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    metrics = {}
+    spreads = {}
+    for key in samples[0]:
+        values = [sample[key] for sample in samples]
+        if key.endswith('_ms'):
+            metrics[key] = min(values)
+            spreads[key] = statistics.median(values) - min(values)
+        else:
+            metrics[key] = statistics.median(values)
+            spreads[key] = max(values) - min(values)
+    return metrics, spreads
+
+def collect(runs=9, first_call_runs=25):
+    """Run the whole suite
+    
+    Returns flat {metric_name: value}, {metric_name: spread} and
+    {timing_metric_name: calibration_ms} dicts.
+    """
+    # Import times depend heavily on whether bytecode is cached. With
+    # PYTHONDONTWRITEBYTECODE set, an edited module would be recompiled in
+    # every child, so bring the caches up to date first.
+    for directory in (os.path.join(ROOT, 'mypackage'), MODULES_EXAMPLE):
+        compileall.compile_dir(directory, quiet=1)
+    results = {}
+    noise = {}
+    calibration = {}
+    for module in MODULES:
+        metrics, spreads = measure(f"import {module}", runs=runs)
+        for key, name in (('import_ms', 'import_ms'), ('rss_kb', 'rss_kb'),
+                          ('rss_delta_kb', 'rss_delta_kb')):
+            results[f"{name}/{module}"] = round(metrics[key], 3)
+            noise[f"{name}/{module}"] = round(spreads[key], 3)
+        calibration[f"import_ms/{module}"] = round(metrics['calibration_ms'], 3)
+    for name, (setup, call) in FIRST_CALLS.items():
+        metrics, spreads = measure(setup, call, runs=first_call_runs)
+        results[f"first_call_ms/{name}"] = round(metrics['call_ms'], 3)
+        noise[f"first_call_ms/{name}"] = round(spreads['call_ms'], 3)
+        calibration[f"first_call_ms/{name}"] = round(metrics['calibration_ms'], 3)
+    return results, noise, calibration
+
+def compare(results, noise, calibration, baseline, baseline_noise, baseline_calibration,
+            threshold, min_ms=0.1, min_kb=256, noise_factor=3.0):
+    """Print changes against a baseline; return the list of regressions
+    
+    A metric regresses only if it is worse by more than `threshold`
+    percent and by more than its noise floor (see the module docstring).
+    """
+    regressions = []
+    print(f"{'metric':<44}{'baseline':>12}{'current':>12}{'change':>10}")
+    for metric, value in results.items():
+        old = baseline.get(metric)
+        if old is None:
+            print(f"{metric:<44}{'-':>12}{value:>12}{'new':>10}")
+            continue
+        if calibration.get(metric) and baseline_calibration.get(metric):
+            value = round(value * baseline_calibration[metric] / calibration[metric], 3)
+        change = (value - old) / old * 100 if old else 0.0
+        flag = ''
+        spread = max(noise.get(metric, 0), baseline_noise.get(metric, 0))
+        floor = max(min_kb if metric.startswith('rss') else min_ms, noise_factor * spread)
+        if change > threshold and value - old > floor:
+            regressions.append(metric)
+            flag = '  REGRESSION'
+        print(f"{metric:<44}{old:>12}{value:>12}{change:>9.1f}%{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="mypackage startup benchmarks")
+    parser.add_argument('--runs', type=int, default=9,
+                        help="fresh interpreters per import metric")
+    parser.add_argument('--json', help="write results to this JSON file")
+    parser.add_argument('--save-baseline', help="write results as a baseline JSON file")
+    parser.add_argument('--compare', help="baseline JSON file to compare against")
+    parser.add_argument('--threshold', type=float, default=20.0,
+                        help="percent slowdown that counts as a regression")
+    parser.add_argument('--min-ms', type=float, default=0.1,
+                        help="ignore timing changes smaller than this many ms")
+    parser.add_argument('--min-kb', type=float, default=256,
+                        help="ignore memory changes smaller than this many KB")
+    parser.add_argument('--first-call-runs', type=int, default=25,
+                        help="fresh interpreters per first-call metric")
+    parser.add_argument('--noise-factor', type=float, default=3.0,
+                        help="multiple of the run-to-run spread that is ignored")
+    args = parser.parse_args()
+
+    results, noise, calibration = collect(args.runs, args.first_call_runs)
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'metrics': results, 'noise': noise, 'calibration': calibration},
+                          file, indent=2, sort_keys=True)
+
+    print("STARTUP BENCHMARKS")
+    print("=" * 78)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            saved = json.load(file)
+        # Older baselines are a flat {metric: value} dict without spreads
+        baseline = saved.get('metrics', saved)
+        regressions = compare(results, noise, calibration, baseline, saved.get('noise', {}),
+                              saved.get('calibration', {}), args.threshold,
+                              args.min_ms, args.min_kb, args.noise_factor)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold}%")
+            sys.exit(1)
+    else:
+        for metric, value in results.items():
+            print(f"{metric:<44}{value:>12}")
+
+if __name__ == "__main__":
+    main()
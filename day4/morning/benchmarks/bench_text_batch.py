@@ -0,0 +1,53 @@
+"""
+Batch Text API Benchmark
+========================
+
+Per-document cost of the single-text TextProcessor methods versus
+clean_texts, extract_words_batch and get_text_stats_batch.
+
+Run from day4/morning:
+    python benchmarks/bench_text_batch.py [documents] [workers]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.text_processor import TextProcessor
+
+MESSAGE = "Order #{i} shipped!  Track it at the usual link. Thanks, Support Team."
+
+def per_document(func, documents):
+    """Microseconds per document for one call of func"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) / documents * 1e6
+
+def run(documents=100000, workers=2):
+    """Compare looping over single-text methods with the batch methods"""
+    texts = [MESSAGE.format(i=i) for i in range(documents)]
+    processor = TextProcessor()
+
+    pairs = [
+        ('clean_text', processor.clean_text, processor.clean_texts),
+        ('extract_words', processor.extract_words, processor.extract_words_batch),
+        ('get_text_stats', processor.get_text_stats, processor.get_text_stats_batch),
+    ]
+
+    print("BATCH TEXT API (microseconds per document)")
+    print("=" * 66)
+    print(f"{'operation':<18}{'loop':>12}{'batch':>12}{f'batch x{workers}':>14}")
+    for name, single, batch in pairs:
+        processor.clear_history()
+        loop = per_document(lambda: [single(text) for text in texts], documents)
+        processor.clear_history()
+        batched = per_document(lambda: batch(texts), documents)
+        pooled = per_document(lambda: batch(texts, workers=workers, chunksize=2048), documents)
+        print(f"{name:<18}{loop:>12.2f}{batched:>12.2f}{pooled:>14.2f}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
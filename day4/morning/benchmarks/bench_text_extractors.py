@@ -0,0 +1,99 @@
+"""
+Text Extractor Benchmarks
+=========================
+
+Times every TextProcessor and string_utils extractor on inputs of
+1 KB, 1 MB and (optionally) 100 MB.
+
+Run from day4/morning:
+    python benchmarks/bench_text_extractors.py          # 1 KB and 1 MB
+    python benchmarks/bench_text_extractors.py --large  # adds 100 MB
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), 'modules_example'))
+
+from mypackage.text_processor import TextProcessor
+import string_utils
+
+SAMPLE = ("Contact support@example.com or visit https://example.com/docs?page=2. "
+          "Order 1234567890123456 costs 19.99 dollars, ship 3 items to room 42! ")
+
+SIZES = {
+    '1 KB': 1024,
+    '1 MB': 1024 * 1024,
+    '100 MB': 100 * 1024 * 1024,
+}
+
+def make_text(size):
+    """Build a text of roughly `size` characters from the sample sentence"""
+    repeats = size // len(SAMPLE) + 1
+    return (SAMPLE * repeats)[:size]
+
+def time_call(func, text, repeat):
+    """Return the best wall-clock time of `repeat` calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def get_extractors():
+    """Map benchmark names to single-argument callables"""
+    processor = TextProcessor()
+
+    def fresh(method):
+        # Clear history so the benchmark measures extraction, not list
+        # growth, and the token memo so repeats are not cache hits
+        def call(text):
+            processor.clear_history()
+            processor.tokenizer.clear_cache()
+            return method(text)
+        return call
+
+    def three_scans(text):
+        processor.clear_history()
+        processor.extract_urls(text)
+        processor.extract_emails(text)
+        return processor.extract_numbers(text)
+
+    return {
+        'TextProcessor.remove_punctuation': fresh(processor.remove_punctuation),
+        'TextProcessor.extract_words': fresh(processor.extract_words),
+        'TextProcessor.extract_numbers': fresh(processor.extract_numbers),
+        'TextProcessor.extract_emails': fresh(processor.extract_emails),
+        'TextProcessor.extract_urls': fresh(processor.extract_urls),
+        'TextProcessor url+email+number (3 scans)': three_scans,
+        'TextProcessor.extract_all (1 scan)': fresh(processor.extract_all),
+        'string_utils.remove_punctuation': string_utils.remove_punctuation,
+        'string_utils.extract_numbers': string_utils.extract_numbers,
+        'string_utils.extract_emails': string_utils.extract_emails,
+        'string_utils.slugify': string_utils.slugify,
+        'string_utils.mask_sensitive_data': string_utils.mask_sensitive_data,
+    }
+
+def run(include_large=False):
+    """Run every extractor at every size and print a table"""
+    sizes = [name for name in SIZES if include_large or name != '100 MB']
+    extractors = get_extractors()
+
+    print("TEXT EXTRACTOR BENCHMARKS")
+    print("=" * 70)
+    print(f"{'extractor':<42}" + "".join(f"{name:>11}" for name in sizes))
+    texts = {name: make_text(SIZES[name]) for name in sizes}
+    for label, func in extractors.items():
+        row = f"{label:<42}"
+        for name in sizes:
+            repeat = 50 if SIZES[name] <= 1024 else 3 if SIZES[name] <= 1024 * 1024 else 1
+            seconds = time_call(func, texts[name], repeat)
+            row += f"{seconds * 1000:>9.3f}ms"
+        print(row)
+
+if __name__ == "__main__":
+    run(include_large='--large' in sys.argv)
@@ -0,0 +1,77 @@
+"""
+Record Validation Benchmark
+===========================
+
+Records per second for validating email, phone and url fields with the
+previous per-call `import re` + raw pattern functions, the precompiled
+validate_* functions, and validate_many (serially and on a process pool).
+Each field cycles through valid and invalid samples.
+
+Run from day4/morning:
+    python benchmarks/bench_validators.py [records] [workers]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.utils import is_valid_url, validate_email, validate_many, validate_phone
+
+EMAILS = ['jane.doe@example.com', 'user+tag@mail.co.uk', 'not-an-email', 'a@b', 'x@y.org']
+PHONES = ['(555) 123-4567', '+1 555 123 4567', '12345', '555.123.4567', 'call me']
+URLS = ['https://example.com/path?q=1', 'http://localhost:8000', 'ftp://files.example.com',
+        'https://', 'http://example.org']
+
+RULES = {'email': 'email', 'phone': 'phone', 'url': 'url'}
+
+def legacy_validate(record):
+    """The previous validators, re-importing re and passing raw patterns"""
+    import re
+    email = bool(re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', record['email']))
+    phone = len(re.sub(r'\D', '', record['phone'])) in [10, 11]
+    url = bool(re.match(r'^https?://[^\s/$.?#].[^\s]*$', record['url']))
+    return email and phone and url
+
+def compiled_validate(record):
+    """The precompiled validate_* functions, one record at a time"""
+    return (validate_email(record['email']) and validate_phone(record['phone'])
+            and is_valid_url(record['url']))
+
+def make_records(count):
+    """count records cycling through valid and invalid samples"""
+    return [
+        {'email': EMAILS[i % 5], 'phone': PHONES[i % 5 - 1], 'url': URLS[i % 5 - 2]}
+        for i in range(count)
+    ]
+
+def timed(func):
+    """Run func once and return (seconds, result)"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def run(count=1000000, workers=4):
+    """Time each approach on `count` records"""
+    records = make_records(count)
+    cases = [
+        ('legacy per record', timed(lambda: [legacy_validate(r) for r in records])),
+        ('compiled per record', timed(lambda: [compiled_validate(r) for r in records])),
+        ('validate_many', timed(lambda: validate_many(records, RULES)['valid'])),
+        (f'validate_many workers={workers}',
+         timed(lambda: validate_many(records, RULES, workers=workers,
+                                     chunk_size=max(1, count // workers))['valid'])),
+    ]
+    expected = cases[0][1][1]
+    print("RECORD VALIDATION THROUGHPUT")
+    print("=" * 62)
+    print(f"Records: {count}, invalid: {expected.count(False)}, CPUs: {os.cpu_count()}")
+    for name, (seconds, valid) in cases:
+        assert valid == expected, name
+        print(f"{name:<32}{seconds:>9.2f}s{count / seconds:>14,.0f} rec/s")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
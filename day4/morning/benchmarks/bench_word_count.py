@@ -0,0 +1,54 @@
+"""
+Word Count Scaling Benchmark
+============================
+
+Compares TextProcessor.count_words on a concatenated corpus with
+TextProcessor.count_words_parallel at 1, 2, 4, 8 and 16 workers.
+
+Run from day4/morning:
+    python benchmarks/bench_word_count.py [documents]
+"""
+
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.text_processor import TextProcessor
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+def make_corpus(documents, words_per_document=500, seed=42):
+    """Build a reproducible corpus of random documents"""
+    rng = random.Random(seed)
+    return [' '.join(rng.choices(VOCABULARY, k=words_per_document)) for _ in range(documents)]
+
+def run(documents=2000):
+    """Time serial and parallel counting on the same corpus"""
+    corpus = make_corpus(documents)
+    processor = TextProcessor()
+
+    print("WORD COUNT SCALING")
+    print("=" * 50)
+    print(f"Documents: {documents}, CPUs available: {os.cpu_count()}")
+
+    start = time.perf_counter()
+    expected = processor.count_words('\n'.join(corpus))
+    serial = time.perf_counter() - start
+    print(f"{'count_words (serial)':<32}{serial:>10.3f}s")
+
+    for workers in (1, 2, 4, 8, 16):
+        if workers > 2 * (os.cpu_count() or 1):
+            print(f"{'workers=' + str(workers):<32}{'skipped':>11}")
+            continue
+        start = time.perf_counter()
+        result = processor.count_words_parallel(corpus, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"{'workers=' + str(workers):<32}{elapsed:>10.3f}s  speedup {serial / elapsed:.2f}x")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
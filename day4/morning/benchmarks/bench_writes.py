@@ -0,0 +1,65 @@
+"""
+Write Path Benchmark
+====================
+
+Compares many small append_text_file calls with the same appends inside
+an append_session, and plain versus atomic write_text_file.
+
+Run from day4/morning:
+    python benchmarks/bench_writes.py [appends] [files_written]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from mypackage.file_handler import FileHandler
+
+LINE = "2024-01-01T00:00:00 INFO request handled in 12ms\n"
+
+def timed(func):
+    """Run func once and return seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def run(appends=20000, files_written=500):
+    """Time appends and whole-file writes in a temp directory"""
+    handler = FileHandler()
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, 'app.log')
+
+        def plain_appends():
+            for _ in range(appends):
+                handler.append_text_file(log_path, LINE)
+
+        def session_appends():
+            with handler.append_session():
+                for _ in range(appends):
+                    handler.append_text_file(log_path, LINE)
+
+        def writes(atomic):
+            content = LINE * 200
+            for i in range(files_written):
+                handler.write_text_file(os.path.join(directory, f"out{i}.txt"), content, atomic=atomic)
+
+        megabytes = appends * len(LINE) / 1024 / 1024
+        print("WRITE PATHS")
+        print("=" * 56)
+        for name, func, size in [
+            (f'{appends} x append_text_file', plain_appends, megabytes),
+            (f'{appends} x append in session', session_appends, megabytes),
+            (f'{files_written} x write_text_file', lambda: writes(False), None),
+            (f'{files_written} x write_text_file atomic', lambda: writes(True), None),
+        ]:
+            seconds = timed(func)
+            rate = f"{size / seconds:8.1f} MB/s" if size else f"{files_written / seconds:8.0f} files/s"
+            print(f"{name:<36}{seconds:>8.3f}s {rate}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    run(*args)
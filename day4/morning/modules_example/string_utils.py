@@ -9,6 +9,15 @@ Demonstrates module creation with various string operations.
 import re
 import string
 
+# Compiled once at import time instead of on every call
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+NUMBER_PATTERN = re.compile(r'\d+')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+SLUG_INVALID_PATTERN = re.compile(r'[^a-z0-9\-]')
+SLUG_HYPHENS_PATTERN = re.compile(r'-+')
+CREDIT_CARD_PATTERN = re.compile(r'\b(\d{4})\d{8}(\d{4})\b')
+MASK_EMAIL_PATTERN = re.compile(r'\b(\w)[^@]*@([^@]+\.[^@]+)\b')
+
 def reverse_string(text):
     """Reverse a string"""
     return text[::-1]
@@ -36,25 +45,24 @@ def capitalize_words(text):
 
 def remove_punctuation(text):
     """Remove punctuation from a string"""
-    return text.translate(str.maketrans("", "", string.punctuation))
+    return text.translate(PUNCTUATION_TABLE)
 
 def extract_numbers(text):
     """Extract all numbers from a string"""
-    return re.findall(r'\d+', text)
+    return NUMBER_PATTERN.findall(text)
 
 def extract_emails(text):
     """Extract email addresses from a string"""
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(pattern, text)
+    return EMAIL_PATTERN.findall(text)
 
 def slugify(text):
     """Convert text to URL-friendly slug"""
     # Convert to lowercase and replace spaces with hyphens
     slug = text.lower().replace(" ", "-")
     # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r'[^a-z0-9\-]', '', slug)
+    slug = SLUG_INVALID_PATTERN.sub('', slug)
     # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = SLUG_HYPHENS_PATTERN.sub('-', slug)
     # Remove leading/trailing hyphens
     return slug.strip('-')
 
@@ -67,12 +75,10 @@ def truncate_text(text, max_length, suffix="..."):
 def mask_sensitive_data(text, mask_char="*"):
     """Mask sensitive data like credit card numbers"""
     # Mask credit card numbers (keep first 4 and last 4 digits)
-    cc_pattern = r'\b(\d{4})\d{8}(\d{4})\b'
-    text = re.sub(cc_pattern, r'\1********\2', text)
+    text = CREDIT_CARD_PATTERN.sub(r'\1********\2', text)
     
     # Mask email addresses (keep first character and domain)
-    email_pattern = r'\b(\w)[^@]*@([^@]+\.[^@]+)\b'
-    text = re.sub(email_pattern, r'\1****@\2', text)
+    text = MASK_EMAIL_PATTERN.sub(r'\1****@\2', text)
     
     return text
 
@@ -4,8 +4,14 @@ My Package - A Complete Package Example
 
 This package demonstrates how to organize Python code into packages.
 It includes multiple modules with different functionalities.
+
+Submodules and the classes below are imported lazily on first access, so
+`from mypackage import quick_math` only loads the utils module.
 """
 
+import importlib
+import os
+
 # Package version
 __version__ = "1.0.0"
 
@@ -21,11 +27,36 @@ __all__ = [
     'quick_text'
 ]
 
-# Import key classes and functions for easy access
-from .calculator import Calculator
-from .text_processor import TextProcessor
-from .file_handler import FileHandler
-from .utils import quick_math, quick_text
+# Key classes and functions, mapped to the submodule that defines them.
+# They are imported on first access by __getattr__ below.
+_LAZY_ATTRIBUTES = {
+    'Calculator': 'calculator',
+    'TextProcessor': 'text_processor',
+    'FileHandler': 'file_handler',
+    'quick_math': 'utils',
+    'quick_text': 'utils'
+}
+
+_SUBMODULES = {
+    'calculator', 'text_processor', 'file_handler', 'async_file_handler', 'utils',
+    'tokenizer', 'aho_corasick', 'sketches', 'compression', 'operation_log'
+}
+
+def __getattr__(name):
+    """Import key classes and submodules the first time they are used"""
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
 
 # Package-level convenience functions
 def get_package_info():
@@ -43,8 +74,15 @@ def list_modules():
         'calculator - Mathematical operations',
         'text_processor - Text manipulation utilities',
         'file_handler - File I/O operations',
-        'utils - Quick utility functions'
+        'async_file_handler - Concurrent file operations on a thread pool',
+        'utils - Quick utility functions',
+        'tokenizer - Reusable token streams with offsets',
+        'aho_corasick - Multi-pattern search and replace',
+        'sketches - Fixed-memory frequency and cardinality sketches',
+        'compression - Transparent gzip, bz2, xz and zstd file streams',
+        'operation_log - Bounded, lazily formatted operation log'
     ]
 
-# Package initialization message
-print(f"Initializing MyPackage v{__version__}")
+# Package initialization message (opt-in, so importing stays side-effect free)
+if os.environ.get('MYPACKAGE_VERBOSE'):
+    print(f"Initializing MyPackage v{__version__}")
@@ -0,0 +1,151 @@
+"""
+Aho-Corasick Module - Part of MyPackage
+=======================================
+
+This module provides an Aho-Corasick automaton for finding or replacing
+many literal patterns in a single linear pass over the text, and a
+Replacer that pairs an automaton with a snapshot of its mapping.
+"""
+
+from collections import deque
+
+class AhoCorasick:
+    """Multi-pattern matcher built once and reused across texts"""
+
+    def __init__(self, patterns):
+        # Node i is described by goto[i] (char -> node), fail[i] and the
+        # lengths of every pattern ending at node i (including via fail links)
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+        self.patterns = []
+        for pattern in patterns:
+            if not pattern:
+                raise ValueError("Patterns must be non-empty strings")
+            self._insert(pattern)
+        self._build_links()
+
+    def _insert(self, pattern):
+        """Add one pattern to the trie"""
+        node = 0
+        for char in pattern:
+            following = self.goto[node].get(char)
+            if following is None:
+                following = len(self.goto)
+                self.goto[node][char] = following
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append(())
+            node = following
+        if len(pattern) not in self.outputs[node]:
+            self.outputs[node] = self.outputs[node] + (len(pattern),)
+            self.patterns.append(pattern)
+
+    def _build_links(self):
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                link = self.goto[state].get(char, 0)
+                self.fail[child] = link if link != child else 0
+                if self.outputs[self.fail[child]]:
+                    self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def iter_matches(self, text):
+        """Yield (start, end) for every (possibly overlapping) match"""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if outputs[node]:
+                end = index + 1
+                for length in outputs[node]:
+                    yield end - length, end
+
+    def find_all(self, text):
+        """All matches as (start, end, pattern), ordered by end offset"""
+        return [(start, end, text[start:end]) for start, end in self.iter_matches(text)]
+
+    def leftmost_longest(self, text):
+        """Non-overlapping matches, preferring the earliest then the longest"""
+        matches = sorted(self.iter_matches(text), key=lambda span: (span[0], -span[1]))
+        selected = []
+        position = 0
+        for start, end in matches:
+            if start >= position:
+                selected.append((start, end))
+                position = end
+        return selected
+
+    def replace(self, text, mapping):
+        """Replace every leftmost-longest match with mapping[pattern]"""
+        pieces = []
+        position = 0
+        for start, end in self.leftmost_longest(text):
+            pieces.append(text[position:start])
+            pieces.append(mapping[text[start:end]])
+            position = end
+        pieces.append(text[position:])
+        return ''.join(pieces)
+
+    def __len__(self):
+        """Number of distinct patterns in the automaton"""
+        return len(self.patterns)
+
+    def __str__(self):
+        """String representation of the automaton"""
+        return f"AhoCorasick ({len(self.patterns)} patterns, {len(self.goto)} states)"
+
+class Replacer:
+    """Compiled old -> new replacement table, built once and applied per text
+    
+    The mapping is copied when the replacer is built, so later changes to
+    the original dict do not affect it.
+    """
+
+    def __init__(self, mapping):
+        self.mapping = dict(mapping)
+        self.automaton = AhoCorasick(self.mapping)
+
+    def replace(self, text):
+        """Replace every leftmost-longest match in a single pass"""
+        return self.automaton.replace(text, self.mapping)
+
+    def find_all(self, text):
+        """All (possibly overlapping) matches as (start, end, pattern)"""
+        return self.automaton.find_all(text)
+
+    def __len__(self):
+        """Number of patterns"""
+        return len(self.mapping)
+
+    def __str__(self):
+        """String representation of the replacer"""
+        return f"Replacer ({len(self.mapping)} patterns)"
+
+# Module testing
+if __name__ == "__main__":
+    print("Testing Aho-Corasick Module")
+    print("=" * 35)
+
+    automaton = AhoCorasick(['he', 'she', 'his', 'hers'])
+    print(automaton)
+    print(f"Matches in 'ushers': {automaton.find_all('ushers')}")
+    assert automaton.find_all('ushers') == [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+
+    mapping = {'cat': 'dog', 'category': 'group', 'dog': 'cat'}
+    replacer = AhoCorasick(mapping)
+    result = replacer.replace('a cat in a category chased a dog', mapping)
+    print(f"Replaced: {result}")
+    assert result == 'a dog in a group chased a cat'
+
+    replacer = Replacer(mapping)
+    mapping['cat'] = 'bird'
+    assert replacer.replace('a cat') == 'a dog'
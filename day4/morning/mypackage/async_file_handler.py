@@ -0,0 +1,101 @@
+"""
+Async File Handler Module - Part of MyPackage
+=============================================
+
+This module provides an AsyncFileHandler that runs FileHandler operations
+on a bounded thread pool so many files can be processed concurrently.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .file_handler import FileHandler
+
+class AsyncFileHandler:
+    """Asyncio front end for FileHandler backed by a bounded thread pool"""
+    
+    def __init__(self, max_workers=8, handler=None):
+        self.max_workers = max_workers
+        self.handler = handler if handler is not None else FileHandler()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='async-file-handler')
+    
+    async def _run(self, func, *args):
+        """Run a blocking call on the thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def read_text_file(self, filename):
+        """Read contents of a text file"""
+        return await self._run(self.handler.read_text_file, filename)
+    
+    async def write_text_file(self, filename, content):
+        """Write content to a text file"""
+        return await self._run(self.handler.write_text_file, filename, content)
+    
+    async def copy_file(self, source, destination):
+        """Copy a file from source to destination"""
+        return await self._run(self.handler.copy_file, source, destination)
+    
+    async def move_file(self, source, destination):
+        """Move a file from source to destination"""
+        return await self._run(self.handler.move_file, source, destination)
+    
+    async def stat(self, filename):
+        """Get the os.stat_result for a file"""
+        return await self._run(os.stat, filename)
+    
+    async def _gather_limited(self, func, items, limit):
+        """Run func(item) for all items, at most `limit` at once
+        
+        Returns {'results': {key: value}, 'errors': {key: exception}} so one
+        failing file does not abort the batch.
+        """
+        semaphore = asyncio.Semaphore(limit or self.max_workers)
+        results = {}
+        errors = {}
+        
+        async def worker(key, args):
+            async with semaphore:
+                try:
+                    results[key] = await func(*args)
+                except Exception as e:
+                    errors[key] = e
+        
+        await asyncio.gather(*(worker(key, args) for key, args in items))
+        return {'results': results, 'errors': errors}
+    
+    async def read_many(self, filenames, limit=None):
+        """Read many text files concurrently, keyed by filename"""
+        return await self._gather_limited(
+            self.read_text_file, [(name, (name,)) for name in filenames], limit)
+    
+    async def stat_many(self, filenames, limit=None):
+        """Stat many files concurrently, keyed by filename"""
+        return await self._gather_limited(
+            self.stat, [(name, (name,)) for name in filenames], limit)
+    
+    async def copy_many(self, pairs, limit=None):
+        """Copy many (source, destination) pairs concurrently, keyed by the pair
+        
+        Keying by pair keeps every result when one source is copied to
+        several destinations.
+        """
+        return await self._gather_limited(
+            self.copy_file, [((source, destination), (source, destination))
+                             for source, destination in pairs], limit)
+    
+    def close(self):
+        """Shut down the thread pool"""
+        self._executor.shutdown(wait=True)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __str__(self):
+        """String representation of the async file handler"""
+        return f"AsyncFileHandler (workers: {self.max_workers}, {self.handler})"
@@ -0,0 +1,183 @@
+"""
+Compression Module - Part of MyPackage
+======================================
+
+This module opens gzip, bz2, xz and zstd files transparently. The format
+is taken from the file extension, or detected from the file header when
+reading a file whose extension says nothing. zstd needs the optional
+`zstandard` package.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'xz',
+    '.zst': 'zstd',
+}
+
+# Extensions of plain text formats; these are never sniffed for magic
+# bytes, which saves an extra open() on every read of common files
+PLAIN_EXTENSIONS = {
+    '.txt', '.csv', '.tsv', '.json', '.jsonl', '.ndjson', '.log', '.md',
+    '.xml', '.html', '.yaml', '.yml', '.ini', '.cfg', '.py',
+}
+
+# Full headers rather than bare magic numbers, so plain text that happens
+# to start with e.g. 'BZh' is not mistaken for a compressed stream
+MAGIC_PATTERNS = [
+    (re.compile(rb'\x1f\x8b\x08'), 'gzip'),
+    (re.compile(rb'BZh[1-9](1AY&SY|\x17rE8P\x90)', re.DOTALL), 'bz2'),
+    (re.compile(rb'\xfd7zXZ\x00'), 'xz'),
+    (re.compile(rb'\x28\xb5\x2f\xfd'), 'zstd'),
+]
+
+DEFAULT_LEVELS = {
+    'gzip': 6,
+    'bz2': 9,
+    'xz': 6,
+    'zstd': 3,
+}
+
+# One-shot compressors used for parallel blocks; concatenated outputs are
+# valid multi-member (gzip) or multi-stream (bz2, xz) files
+_BLOCK_COMPRESSORS = {
+    'gzip': lambda data, level: gzip.compress(data, compresslevel=level),
+    'bz2': lambda data, level: bz2.compress(data, compresslevel=level),
+    'xz': lambda data, level: lzma.compress(data, preset=level),
+}
+
+def detect_compression(filename, mode='r'):
+    """Compression kind of a file ('gzip', 'bz2', 'xz', 'zstd') or None
+
+    A compression extension always decides, as does a plain text extension
+    (see PLAIN_EXTENSIONS). For reading a file with no or an unknown
+    extension, the header of the existing file is checked instead.
+    """
+    extension = os.path.splitext(str(filename))[1].lower()
+    if extension in EXTENSIONS:
+        return EXTENSIONS[extension]
+    if not mode.startswith('r') or extension in PLAIN_EXTENSIONS:
+        return None
+    try:
+        with open(filename, 'rb') as file:
+            head = file.read(10)
+    except OSError:
+        return None
+    for pattern, kind in MAGIC_PATTERNS:
+        if pattern.match(head):
+            return kind
+    return None
+
+def _require_zstandard():
+    """Raise a clear error when zstd is requested but not installed"""
+    if zstandard is None:
+        raise ImportError("zstd support requires the 'zstandard' package (pip install zstandard)")
+
+class ParallelCompressedWriter(io.RawIOBase):
+    """Binary writer that compresses fixed-size blocks on a thread pool
+
+    zlib, bz2 and lzma release the GIL while compressing, so blocks are
+    compressed concurrently and written out in order.
+    """
+
+    def __init__(self, filename, kind, level, mode='wb', workers=4, block_size=4 * 1024 * 1024):
+        if kind not in _BLOCK_COMPRESSORS:
+            raise ValueError(f"Parallel compression is not supported for '{kind}'")
+        self._file = open(filename, mode)
+        self._compress = _BLOCK_COMPRESSORS[kind]
+        self._level = level
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._pending = []
+        self._max_pending = workers * 2
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[:self._block_size])
+            del self._buffer[:self._block_size]
+            self._submit(block)
+        return len(data)
+
+    def _submit(self, block):
+        """Queue a block for compression, writing finished blocks in order"""
+        self._pending.append(self._pool.submit(self._compress, block, self._level))
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.pop(0).result())
+
+    def flush(self):
+        """Write out completed blocks (a partial block stays buffered)"""
+        while self._pending and self._pending[0].done():
+            self._file.write(self._pending.pop(0).result())
+        self._file.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            for future in self._pending:
+                self._file.write(future.result())
+            self._pending.clear()
+        finally:
+            self._pool.shutdown(wait=True)
+            try:
+                super().close()
+            finally:
+                self._file.close()
+
+def open_binary(filename, mode='rb', kind=None, level=None, workers=None):
+    """Open filename as a binary stream, (de)compressing `kind` if given
+
+    workers > 1 enables parallel block compression for gzip, bz2 and xz
+    writes.
+    """
+    if kind is None:
+        return open(filename, mode)
+    if level is None:
+        level = DEFAULT_LEVELS[kind]
+    writing = not mode.startswith('r')
+    if writing and workers and workers > 1 and kind in _BLOCK_COMPRESSORS:
+        return io.BufferedWriter(ParallelCompressedWriter(filename, kind, level, mode, workers))
+    if kind == 'gzip':
+        return gzip.open(filename, mode, compresslevel=level)
+    if kind == 'bz2':
+        return bz2.open(filename, mode, compresslevel=level)
+    if kind == 'xz':
+        return lzma.open(filename, mode, preset=level if writing else None)
+    if kind == 'zstd':
+        _require_zstandard()
+        raw = open(filename, mode)
+        if writing:
+            return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    raise ValueError(f"Unknown compression '{kind}'")
+
+def open_text(filename, mode='r', kind=None, level=None, workers=None, newline=None,
+              buffering=-1, encoding='utf-8'):
+    """Open filename as a text stream, (de)compressing `kind` if given"""
+    if kind is None:
+        return open(filename, mode, encoding=encoding, newline=newline, buffering=buffering)
+    binary = open_binary(filename, mode + 'b', kind, level, workers)
+    return io.TextIOWrapper(binary, encoding=encoding, newline=newline)
@@ -0,0 +1,97 @@
+"""
+Operation Log Module - Part of MyPackage
+========================================
+
+This module provides OperationLog, a bounded ring buffer of structured
+log entries. Each entry is (monotonic_ns, template, args); the message is
+only formatted when the log is read or spilled to disk.
+"""
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+class OperationLog:
+    """Bounded, lazily formatted log of operations"""
+
+    def __init__(self, maxlen=1000, enabled=True, sample_every=1,
+                 spill_path=None, spill_max_bytes=10 * 1024 * 1024, spill_backups=3):
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.entries = deque(maxlen=maxlen)
+        self.enabled = enabled
+        self.sample_every = sample_every
+        self.dropped = 0
+        self._seen = 0
+        # Anchor monotonic timestamps to the wall clock once
+        self._wall_ns = time.time_ns()
+        self._monotonic_ns = time.monotonic_ns()
+        self._spill = None
+        if spill_path is not None:
+            self._spill = RotatingFileHandler(spill_path, maxBytes=spill_max_bytes,
+                                              backupCount=spill_backups, encoding='utf-8')
+            self._spill.setFormatter(logging.Formatter('%(message)s'))
+
+    def record(self, template, *args):
+        """Append an entry; template is a str.format pattern for args"""
+        if not self.enabled:
+            return
+        self._seen += 1
+        if self.sample_every > 1 and self._seen % self.sample_every:
+            return
+        entries = self.entries
+        if entries.maxlen is not None and len(entries) == entries.maxlen:
+            self.dropped += 1
+            if self._spill is not None:
+                self._write_spill(entries[0])
+        entries.append((time.monotonic_ns(), template, args))
+
+    def format_entry(self, entry):
+        """Format one entry as '[ISO timestamp] message'"""
+        monotonic_ns, template, args = entry
+        wall_seconds = (self._wall_ns + monotonic_ns - self._monotonic_ns) / 1e9
+        timestamp = datetime.fromtimestamp(wall_seconds).isoformat()
+        return f"[{timestamp}] {template.format(*args)}"
+
+    def formatted(self):
+        """All retained entries as formatted strings, oldest first"""
+        return [self.format_entry(entry) for entry in self.entries]
+
+    def _write_spill(self, entry):
+        """Write an entry about to be evicted to the rotating spill file"""
+        self._spill.handle(logging.makeLogRecord({'msg': self.format_entry(entry)}))
+
+    def flush(self):
+        """Spill every retained entry to disk and empty the buffer"""
+        if self._spill is not None:
+            for entry in self.entries:
+                self._write_spill(entry)
+            self._spill.flush()
+        self.entries.clear()
+
+    def clear(self):
+        """Drop all retained entries without spilling them"""
+        self.entries.clear()
+        self.dropped = 0
+
+    def close(self):
+        """Flush and close the spill file, if any"""
+        self.flush()
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def __len__(self):
+        """Number of retained entries"""
+        return len(self.entries)
+
+    def __iter__(self):
+        """Iterate over formatted entries, oldest first"""
+        for entry in self.entries:
+            yield self.format_entry(entry)
+
+    def __str__(self):
+        """String representation of the log"""
+        return f"OperationLog ({len(self.entries)}/{self.entries.maxlen} entries, {self.dropped} dropped)"
@@ -0,0 +1,268 @@
+"""
+Sketches Module - Part of MyPackage
+===================================
+
+This module provides fixed-memory probabilistic summaries for word streams.
+
+- CountMinSketch: frequency estimates that never undercount.
+  With width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)), an
+  estimate exceeds the true count by more than epsilon * N (N = total
+  items added) with probability at most delta.
+- SpaceSaving: top-k heavy hitters with `capacity` counters.
+  Every item whose true count is above N / capacity is kept, and each
+  reported count overestimates the true count by at most N / capacity.
+- HyperLogLog: distinct counts with 2 ** precision registers.
+  The relative standard error is about 1.04 / sqrt(2 ** precision).
+
+All sketches hash with blake2b rather than the built-in hash(), so
+sketches built in different processes can be merged.
+"""
+
+import hashlib
+import heapq
+import math
+
+def _hash64(item, salt=b''):
+    """Stable 64-bit hash of a string (identical across processes)"""
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=8, salt=salt).digest()
+    return int.from_bytes(digest, 'big')
+
+class CountMinSketch:
+    """Count-Min sketch for approximate item frequencies"""
+
+    def __init__(self, epsilon=0.001, delta=0.01):
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = [[0] * self.width for _ in range(self.depth)]
+        self.total = 0
+
+    def _indexes(self, item):
+        """Row indexes from one 64-bit hash using double hashing"""
+        value = _hash64(item)
+        h1, h2 = value & 0xFFFFFFFF, (value >> 32) | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, item, count=1):
+        """Add `count` occurrences of an item"""
+        for row, index in enumerate(self._indexes(item)):
+            self.table[row][index] += count
+        self.total += count
+
+    def update(self, items):
+        """Add every item of an iterable once"""
+        for item in items:
+            self.add(item)
+
+    def estimate(self, item):
+        """Estimated count of an item (never below the true count)"""
+        return min(self.table[row][index] for row, index in enumerate(self._indexes(item)))
+
+    def error_bound(self):
+        """Maximum overestimate that holds with probability 1 - delta"""
+        return self.epsilon * self.total
+
+    def merge(self, other):
+        """Merge another sketch with the same dimensions into this one"""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge Count-Min sketches with different dimensions")
+        for row, other_row in zip(self.table, other.table):
+            for index, value in enumerate(other_row):
+                row[index] += value
+        self.total += other.total
+        return self
+
+    def __str__(self):
+        """String representation of the sketch"""
+        return f"CountMinSketch ({self.depth}x{self.width}, {self.total} items)"
+
+class SpaceSaving:
+    """Space-Saving summary for approximate top-k items"""
+
+    def __init__(self, capacity=1000):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        self._heap = []
+
+    def _min_item(self):
+        """Pop stale heap entries until the top matches a live counter"""
+        while True:
+            count, item = self._heap[0]
+            if self.counts.get(item) == count:
+                return item
+            heapq.heappop(self._heap)
+
+    def add(self, item, count=1):
+        """Add `count` occurrences of an item"""
+        self.total += count
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            # Replace the smallest counter; its count becomes this item's error
+            evicted = self._min_item()
+            floor = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(n, key) for key, n in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, items):
+        """Add every item of an iterable once"""
+        for item in items:
+            self.add(item)
+
+    def estimate(self, item):
+        """Estimated count of an item (0 if it is not tracked)"""
+        return self.counts.get(item, 0)
+
+    def top(self, k=10):
+        """Top-k items as (item, estimated_count) pairs"""
+        return heapq.nlargest(k, self.counts.items(), key=lambda pair: pair[1])
+
+    def guaranteed_top(self, k=10):
+        """Top-k items whose rank is certain (count - error beats the next count)"""
+        ranked = self.top(k + 1)
+        guaranteed = []
+        for i, (item, count) in enumerate(ranked[:k]):
+            following = ranked[i + 1][1] if i + 1 < len(ranked) else 0
+            if count - self.errors[item] < following:
+                break
+            guaranteed.append((item, count))
+        return guaranteed
+
+    def error_bound(self):
+        """Maximum overestimate of any reported count"""
+        return self.total / self.capacity
+
+    def merge(self, other):
+        """Merge another summary into this one, keeping `capacity` counters"""
+        self_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+        counts = {}
+        errors = {}
+        for item in set(self.counts) | set(other.counts):
+            counts[item] = self.counts.get(item, self_floor) + other.counts.get(item, other_floor)
+            errors[item] = (self.errors.get(item, self_floor) +
+                            other.errors.get(item, other_floor))
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+        self.total += other.total
+        self._heap = [(n, key) for key, n in self.counts.items()]
+        heapq.heapify(self._heap)
+        return self
+
+    def __str__(self):
+        """String representation of the summary"""
+        return f"SpaceSaving ({len(self.counts)}/{self.capacity} counters, {self.total} items)"
+
+class HyperLogLog:
+    """HyperLogLog sketch for approximate distinct counts"""
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+        if self.size >= 128:
+            self._alpha = 0.7213 / (1 + 1.079 / self.size)
+        else:
+            self._alpha = {16: 0.673, 32: 0.697, 64: 0.709}[self.size]
+
+    def add(self, item):
+        """Add an item"""
+        value = _hash64(item)
+        index = value >> (64 - self.precision)
+        remaining = value & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, items):
+        """Add every item of an iterable"""
+        for item in items:
+            self.add(item)
+
+    def count(self):
+        """Estimated number of distinct items"""
+        estimate = self._alpha * self.size ** 2 / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Small-range correction: linear counting
+            estimate = self.size * math.log(self.size / zeros)
+        return int(round(estimate))
+
+    def error_bound(self):
+        """Relative standard error of count()"""
+        return 1.04 / math.sqrt(self.size)
+
+    def merge(self, other):
+        """Merge another sketch with the same precision into this one"""
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+        return self
+
+    def __str__(self):
+        """String representation of the sketch"""
+        return f"HyperLogLog (precision {self.precision}, ~{self.count()} distinct)"
+
+# Module testing: compare every sketch against exact counts
+if __name__ == "__main__":
+    import random
+    from collections import Counter
+
+    print("Testing Sketches Module")
+    print("=" * 35)
+
+    rng = random.Random(7)
+    # Zipf-like stream so there are clear heavy hitters
+    vocabulary = [f"w{i}" for i in range(20000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    stream = rng.choices(vocabulary, weights=weights, k=200000)
+    exact = Counter(stream)
+
+    cms = CountMinSketch(epsilon=0.001, delta=0.01)
+    cms.update(stream)
+    worst = max(cms.estimate(word) - n for word, n in exact.items())
+    assert all(cms.estimate(word) >= n for word, n in exact.items())
+    assert worst <= cms.error_bound()
+    print(f"{cms}: worst overestimate {worst} <= bound {cms.error_bound():.0f}")
+
+    halves = SpaceSaving(500), SpaceSaving(500)
+    halves[0].update(stream[:100000])
+    halves[1].update(stream[100000:])
+    space_saving = halves[0].merge(halves[1])
+    bound = space_saving.error_bound()
+    for word, n in exact.items():
+        if n > bound:
+            assert word in space_saving.counts, word
+    for word, estimate in space_saving.top(10):
+        assert 0 <= estimate - exact[word] <= bound
+    assert [w for w, _ in space_saving.top(5)] == [w for w, _ in exact.most_common(5)]
+    print(f"{space_saving}: top-5 matches exact, bound {bound:.0f}")
+
+    parts = HyperLogLog(12), HyperLogLog(12)
+    parts[0].update(stream[::2])
+    parts[1].update(stream[1::2])
+    hll = parts[0].merge(parts[1])
+    relative_error = abs(hll.count() - len(exact)) / len(exact)
+    assert relative_error <= 3 * hll.error_bound()
+    print(f"HyperLogLog: {hll.count()} vs exact {len(exact)} "
+          f"(error {relative_error:.3%}, 3-sigma bound {3 * hll.error_bound():.3%})")
+
+    print("All sketch checks passed")
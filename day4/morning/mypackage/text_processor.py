@@ -5,44 +5,229 @@ Text Processor Module - Part of MyPackage
 This module provides a TextProcessor class for text manipulation.
 """
 
+import os
 import re
 import string
 from collections import Counter
+from functools import lru_cache
+
+from .aho_corasick import AhoCorasick, Replacer
+from .sketches import CountMinSketch, SpaceSaving, HyperLogLog
+from .tokenizer import Tokenizer
+
+# Precompiled patterns and translation tables shared by every instance
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Entity kinds understood by extract_all, in match priority order
+ENTITY_PATTERNS = {
+    'url': URL_PATTERN,
+    'email': EMAIL_PATTERN,
+    'number': NUMBER_PATTERN,
+}
+
+# Registry of named user-supplied patterns
+_pattern_registry = {}
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern, flags=0):
+    """Compile a regex pattern, reusing previously compiled patterns"""
+    return re.compile(pattern, flags)
+
+def register_pattern(name, pattern, flags=0):
+    """Register a named pattern for use with TextProcessor.extract_pattern"""
+    _pattern_registry[name] = compile_pattern(pattern, flags)
+    return _pattern_registry[name]
+
+def get_pattern(name):
+    """Get a registered pattern by name"""
+    if name not in _pattern_registry:
+        raise KeyError(f"Unknown pattern '{name}'")
+    return _pattern_registry[name]
+
+def list_patterns():
+    """List the names of all registered patterns"""
+    return sorted(_pattern_registry)
+
+def _entity_pattern(kinds):
+    """Build (and cache) one alternation regex covering all requested kinds"""
+    unknown = [kind for kind in kinds if kind not in ENTITY_PATTERNS]
+    if unknown:
+        raise ValueError(f"Unknown entity kinds: {unknown}. Choose from {list(ENTITY_PATTERNS)}")
+    # Keep the priority order of ENTITY_PATTERNS regardless of the order requested
+    ordered = [kind for kind in ENTITY_PATTERNS if kind in kinds]
+    combined = '|'.join(f"(?P<{kind}>{ENTITY_PATTERNS[kind].pattern})" for kind in ordered)
+    return compile_pattern(combined)
+
+def _count_chunk(items, from_files=False, min_count=1):
+    """Count words in a chunk of texts (or file paths) inside a worker process"""
+    counts = Counter()
+    for item in items:
+        if from_files:
+            with open(item, 'r', encoding='utf-8') as file:
+                for line in file:
+                    counts.update(WORD_PATTERN.findall(line.lower()))
+        else:
+            counts.update(WORD_PATTERN.findall(item.lower()))
+    if min_count > 1:
+        counts = Counter({word: n for word, n in counts.items() if n >= min_count})
+    return counts
+
+def _tree_reduce(counters):
+    """Merge Counters pairwise so no single merge grows far ahead of the others"""
+    counters = list(counters)
+    if not counters:
+        return Counter()
+    while len(counters) > 1:
+        merged = []
+        for i in range(0, len(counters) - 1, 2):
+            left = counters[i]
+            left.update(counters[i + 1])
+            merged.append(left)
+        if len(counters) % 2:
+            merged.append(counters[-1])
+        counters = merged
+    return counters[0]
+
+def _clean_text(text):
+    """Collapse whitespace and lowercase (shared by clean_text and clean_texts)"""
+    return WHITESPACE_PATTERN.sub(' ', text.strip().lower())
+
+def _extract_words(text):
+    """Lowercase word list (shared by extract_words and extract_words_batch)"""
+    return WORD_PATTERN.findall(text.lower())
+
+def _text_stats(text, words=None):
+    """Statistics dict for one text (shared by get_text_stats and its batch form)"""
+    if words is None:
+        words = _extract_words(text)
+    word_count = len(words)
+    return {
+        'characters': len(text),
+        'characters_no_spaces': len(text.replace(' ', '')),
+        'words': word_count,
+        'sentences': len(SENTENCE_END_PATTERN.findall(text)),
+        'paragraphs': len(text.split('\n\n')),
+        'average_word_length': sum(len(word) for word in words) / word_count if words else 0
+    }
+
+def _run_batch(func, texts, workers=None, chunksize=256):
+    """Apply func to every text, optionally across a process pool"""
+    if workers is None or workers <= 1:
+        return [func(text) for text in texts]
+    # Imported here: the process pool pulls in multiprocessing, which would
+    # otherwise slow down every import of this module
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, texts, chunksize=chunksize))
+
+def _convert_number(value):
+    """Convert a matched number string the same way extract_numbers does"""
+    return float(value) if '.' in value else int(value)
 
 class TextProcessor:
     """A text processor class with various text manipulation methods"""
     
     def __init__(self):
         self.processed_texts = []
+        self._automata = {}
+        self.tokenizer = Tokenizer()
     
     def clean_text(self, text):
         """Clean text by removing extra whitespace and converting to lowercase"""
-        cleaned = re.sub(r'\s+', ' ', text.strip().lower())
+        cleaned = _clean_text(text)
         self._record_processing(f"Cleaned text: '{text}' -> '{cleaned}'")
         return cleaned
     
     def remove_punctuation(self, text):
         """Remove punctuation from text"""
-        cleaned = text.translate(str.maketrans('', '', string.punctuation))
+        cleaned = text.translate(PUNCTUATION_TABLE)
         self._record_processing(f"Removed punctuation: '{text}' -> '{cleaned}'")
         return cleaned
     
+    def tokenize(self, text):
+        """Get the memoized TokenStream (offsets, types, lowercase forms) for text"""
+        return self.tokenizer.tokenize(text)
+    
     def extract_words(self, text):
         """Extract words from text"""
-        words = re.findall(r'\b\w+\b', text.lower())
-        self._record_processing(f"Extracted {len(words)} words from text")
-        return words
+        return list(self._words(text))
     
     def count_words(self, text):
         """Count word frequency in text"""
-        words = self.extract_words(text)
+        words = self._words(text)
         word_count = Counter(words)
         self._record_processing(f"Counted words in text: {len(word_count)} unique words")
         return dict(word_count)
     
+    def count_words_parallel(self, paths_or_texts, workers=None, from_files=False,
+                             top_k=None, min_count=1, chunk_min_count=1):
+        """Count word frequency across many documents using a process pool
+        
+        Documents are split into chunks, each chunk is counted in a worker
+        and the per-chunk Counters are merged with a tree reduction.
+        Set from_files=True to treat the items as file paths.
+        top_k and min_count prune the final result. chunk_min_count drops
+        rare words from each chunk before merging; this bounds merge memory
+        but makes counts approximate (a word may be undercounted by up to
+        chunk_min_count - 1 per chunk).
+        """
+        items = list(paths_or_texts)
+        workers = workers or os.cpu_count() or 1
+        if not items:
+            return {}
+        
+        chunk_count = min(len(items), workers * 4)
+        chunk_size = -(-len(items) // chunk_count)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        
+        if workers == 1:
+            counters = [_count_chunk(chunk, from_files, chunk_min_count) for chunk in chunks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor  # lazy, see _run_batch
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                counters = list(pool.map(_count_chunk, chunks,
+                                         [from_files] * len(chunks),
+                                         [chunk_min_count] * len(chunks)))
+        word_count = _tree_reduce(counters)
+        
+        if top_k is not None:
+            pairs = word_count.most_common(top_k)
+        else:
+            pairs = word_count.items()
+        result = {word: n for word, n in pairs if n >= min_count}
+        self._record_processing(
+            f"Counted words in {len(items)} documents with {workers} workers: {len(result)} unique words"
+        )
+        return result
+    
+    def top_words_sketch(self, texts, capacity=1000, sketch=None):
+        """Stream texts into a fixed-memory Space-Saving top-k summary
+        
+        Pass an existing sketch to keep accumulating; sketches from
+        different workers can be combined with sketch.merge(other).
+        """
+        sketch = sketch if sketch is not None else SpaceSaving(capacity)
+        return self._feed_sketch(texts, sketch)
+    
+    def word_frequency_sketch(self, texts, epsilon=0.001, delta=0.01, sketch=None):
+        """Stream texts into a fixed-memory Count-Min frequency sketch"""
+        sketch = sketch if sketch is not None else CountMinSketch(epsilon, delta)
+        return self._feed_sketch(texts, sketch)
+    
+    def distinct_words_sketch(self, texts, precision=14, sketch=None):
+        """Stream texts into a fixed-memory HyperLogLog distinct-word counter"""
+        sketch = sketch if sketch is not None else HyperLogLog(precision)
+        return self._feed_sketch(texts, sketch)
+    
     def find_longest_word(self, text):
         """Find the longest word in text"""
-        words = self.extract_words(text)
+        words = self._words(text)
         if not words:
             return None
         longest = max(words, key=len)
@@ -51,7 +236,7 @@ class TextProcessor:
     
     def find_shortest_word(self, text):
         """Find the shortest word in text"""
-        words = self.extract_words(text)
+        words = self._words(text)
         if not words:
             return None
         shortest = min(words, key=len)
@@ -89,24 +274,65 @@ class TextProcessor:
     
     def extract_numbers(self, text):
         """Extract numbers from text"""
-        numbers = re.findall(r'\d+\.?\d*', text)
+        numbers = NUMBER_PATTERN.findall(text)
         self._record_processing(f"Extracted numbers: {numbers}")
         return [float(num) if '.' in num else int(num) for num in numbers]
     
     def extract_emails(self, text):
         """Extract email addresses from text"""
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(pattern, text)
+        emails = EMAIL_PATTERN.findall(text)
         self._record_processing(f"Extracted emails: {emails}")
         return emails
     
     def extract_urls(self, text):
         """Extract URLs from text"""
-        pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(pattern, text)
+        urls = URL_PATTERN.findall(text)
         self._record_processing(f"Extracted URLs: {urls}")
         return urls
     
+    def iter_all(self, text, kinds=None):
+        """Lazily yield (kind, value, start, end) for every entity in one pass
+        
+        kinds=None means every kind; an empty list yields nothing.
+        """
+        kinds = tuple(ENTITY_PATTERNS) if kinds is None else tuple(kinds)
+        if not kinds:
+            return
+        pattern = _entity_pattern(kinds)
+        for match in pattern.finditer(text):
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'number':
+                value = _convert_number(value)
+            yield kind, value, match.start(), match.end()
+    
+    def extract_all(self, text, kinds=None):
+        """Extract urls, emails and numbers with their offsets in a single scan
+        
+        Returns a dict mapping each kind to a list of (value, start, end).
+        Matches do not overlap, so digits inside a URL or email are not
+        reported again as numbers.
+        """
+        kinds = list(ENTITY_PATTERNS) if kinds is None else list(kinds)
+        results = {kind: [] for kind in kinds}
+        for kind, value, start, end in self.iter_all(text, kinds):
+            results[kind].append((value, start, end))
+        counts = ', '.join(f"{len(found)} {kind}" for kind, found in results.items())
+        self._record_processing(f"Extracted entities in one pass: {counts}")
+        return results
+    
+    def extract_pattern(self, text, pattern):
+        """Extract matches of a registered pattern name or a raw regex"""
+        if isinstance(pattern, str) and pattern in _pattern_registry:
+            compiled = _pattern_registry[pattern]
+        elif isinstance(pattern, re.Pattern):
+            compiled = pattern
+        else:
+            compiled = compile_pattern(pattern)
+        matches = compiled.findall(text)
+        self._record_processing(f"Extracted {len(matches)} matches for pattern '{compiled.pattern}'")
+        return matches
+    
     def replace_text(self, text, old, new):
         """Replace text with new text"""
         result = text.replace(old, new)
@@ -114,6 +340,44 @@ class TextProcessor:
         self._record_processing(f"Replaced '{old}' with '{new}' ({count} occurrences)")
         return result
     
+    def build_replacer(self, mapping):
+        """Compile a mapping once for repeated replace_many calls
+        
+        The returned Replacer holds a snapshot of mapping; use its
+        .replace(text) directly or pass it to replace_many.
+        """
+        replacer = Replacer(mapping)
+        self._record_processing(f"Built replacer for {len(replacer)} patterns")
+        return replacer
+    
+    def replace_many(self, text, mapping):
+        """Apply many old -> new replacements in a single pass
+        
+        Overlapping keys resolve leftmost-longest. mapping is a dict or a
+        Replacer from build_replacer. For a dict the automaton is cached by
+        its set of keys, which still costs O(keys) per call to check; on
+        hot paths build a Replacer once instead.
+        """
+        if isinstance(mapping, Replacer):
+            result = mapping.replace(text)
+            count = len(mapping)
+        else:
+            automaton = self._get_automaton(mapping)
+            result = automaton.replace(text, mapping)
+            count = len(automaton)
+        self._record_processing(f"Replaced using {count} patterns in one pass")
+        return result
+    
+    def find_many(self, text, patterns):
+        """Find every occurrence of many literal patterns in a single pass
+        
+        Returns (start, end, pattern) tuples, including overlapping matches.
+        """
+        patterns = tuple(patterns)
+        matches = self._get_automaton(patterns).find_all(text)
+        self._record_processing(f"Found {len(matches)} matches for {len(patterns)} patterns")
+        return matches
+    
     def truncate_text(self, text, max_length, suffix="..."):
         """Truncate text to specified length"""
         if len(text) <= max_length:
@@ -124,25 +388,33 @@ class TextProcessor:
     
     def get_text_stats(self, text):
         """Get comprehensive statistics about text"""
-        words = self.extract_words(text)
-        word_count = len(words)
-        char_count = len(text)
-        char_count_no_spaces = len(text.replace(' ', ''))
-        sentence_count = len(re.findall(r'[.!?]+', text))
-        paragraph_count = len(text.split('\n\n'))
-        
-        stats = {
-            'characters': char_count,
-            'characters_no_spaces': char_count_no_spaces,
-            'words': word_count,
-            'sentences': sentence_count,
-            'paragraphs': paragraph_count,
-            'average_word_length': sum(len(word) for word in words) / word_count if words else 0
-        }
-        
-        self._record_processing(f"Generated text statistics: {word_count} words, {char_count} characters")
+        words = self._words(text)
+        stats = _text_stats(text, words)
+        self._record_processing(f"Generated text statistics: {stats['words']} words, {stats['characters']} characters")
         return stats
     
+    def clean_texts(self, texts, workers=None, chunksize=256):
+        """Clean a list or iterator of texts in one call
+        
+        Records a single history entry for the whole batch. Pass workers > 1
+        to spread the batch over a process pool.
+        """
+        results = _run_batch(_clean_text, texts, workers, chunksize)
+        self._record_processing(f"Cleaned batch of {len(results)} texts")
+        return results
+    
+    def extract_words_batch(self, texts, workers=None, chunksize=256):
+        """Extract words from a list or iterator of texts in one call"""
+        results = _run_batch(_extract_words, texts, workers, chunksize)
+        self._record_processing(f"Extracted words from batch of {len(results)} texts")
+        return results
+    
+    def get_text_stats_batch(self, texts, workers=None, chunksize=256):
+        """Get statistics for a list or iterator of texts in one call"""
+        results = _run_batch(_text_stats, texts, workers, chunksize)
+        self._record_processing(f"Generated text statistics for batch of {len(results)} texts")
+        return results
+    
     def get_processing_history(self):
         """Get history of text processing operations"""
         return self.processed_texts.copy()
@@ -151,6 +423,36 @@ class TextProcessor:
         """Clear processing history"""
         self.processed_texts = []
     
+    def _words(self, text):
+        """Shared (uncopied) word list from the memoized token stream"""
+        words = self.tokenizer.tokenize(text).words()
+        self._record_processing(f"Extracted {len(words)} words from text")
+        return words
+    
+    def _get_automaton(self, patterns, max_cached=8):
+        """Return a cached Aho-Corasick automaton for this set of patterns"""
+        # Keyed by the patterns themselves, so a mapping edited in place
+        # (even to the same size) gets a fresh automaton
+        key = frozenset(patterns)
+        automaton = self._automata.get(key)
+        if automaton is None:
+            if len(self._automata) >= max_cached:
+                self._automata.pop(next(iter(self._automata)))
+            automaton = self._automata[key] = AhoCorasick(key)
+        return automaton
+    
+    def _feed_sketch(self, texts, sketch):
+        """Add the words of every text to a sketch"""
+        if isinstance(texts, str):
+            texts = [texts]
+        documents = 0
+        for text in texts:
+            for match in WORD_PATTERN.finditer(text.lower()):
+                sketch.add(match.group())
+            documents += 1
+        self._record_processing(f"Streamed {documents} texts into {sketch}")
+        return sketch
+    
     def _record_processing(self, operation):
         """Record a processing operation"""
         self.processed_texts.append(operation)
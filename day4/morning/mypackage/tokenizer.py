@@ -0,0 +1,146 @@
+"""
+Tokenizer Module - Part of MyPackage
+====================================
+
+This module provides a Tokenizer that splits text into a reusable
+TokenStream. Tokens are stored as offsets into the original string, so
+no substrings are created until a token is actually read. The offsets are
+only computed when tokens are accessed; the word list alone comes from a
+single findall.
+"""
+
+import re
+from array import array
+from collections import OrderedDict, namedtuple
+
+# \w and \s are Unicode-aware for str patterns
+TOKEN_PATTERN = re.compile(r'(\w+)|[^\w\s]')
+WORD_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Token type codes stored in TokenStream.types
+WORD, NUMBER, ALNUM, PUNCT = range(4)
+TYPE_NAMES = ('word', 'number', 'alnum', 'punct')
+
+Token = namedtuple('Token', ['text', 'start', 'end', 'type'])
+
+def _classify(value):
+    """Type code for a \\w+ run"""
+    if value.isalpha():
+        return WORD
+    if value.isdigit():
+        return NUMBER
+    return ALNUM
+
+class TokenStream:
+    """Tokens of one text, stored as parallel offset and type arrays"""
+
+    def __init__(self, text):
+        self.text = text
+        self._arrays = None
+        self._words = None
+
+    def _build(self):
+        """(starts, ends, types) arrays, computed on first use"""
+        if self._arrays is None:
+            starts = array('q')
+            ends = array('q')
+            types = array('b')
+            for match in TOKEN_PATTERN.finditer(self.text):
+                starts.append(match.start())
+                ends.append(match.end())
+                word = match.group(1)
+                types.append(_classify(word) if word is not None else PUNCT)
+            self._arrays = (starts, ends, types)
+        return self._arrays
+
+    @property
+    def starts(self):
+        """Start offset of each token"""
+        return self._build()[0]
+
+    @property
+    def ends(self):
+        """End offset of each token"""
+        return self._build()[1]
+
+    @property
+    def types(self):
+        """Type code of each token"""
+        return self._build()[2]
+
+    def __len__(self):
+        """Number of tokens (including punctuation)"""
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        """Token at a position, sliced from the original text on access"""
+        start, end = self.starts[index], self.ends[index]
+        return Token(self.text[start:end], start, end, TYPE_NAMES[self.types[index]])
+
+    def __iter__(self):
+        """Iterate over tokens lazily"""
+        for index in range(len(self.starts)):
+            yield self[index]
+
+    def words(self):
+        """Words of the lowercased text (computed once)
+
+        The returned list is shared by every caller; copy it before mutating.
+        """
+        if self._words is None:
+            # Lowercase before splitting, as the other word extractors do, so
+            # characters that lowercase to a combining mark split the same way
+            self._words = WORD_TOKEN_PATTERN.findall(self.text.lower())
+        return self._words
+
+    def count(self, kind):
+        """Number of tokens of a type name ('word', 'number', 'alnum', 'punct')"""
+        return self.types.count(TYPE_NAMES.index(kind))
+
+    def __str__(self):
+        """String representation of the token stream"""
+        return f"TokenStream ({len(self)} tokens, {len(self.text)} characters)"
+
+class Tokenizer:
+    """Tokenizer with a small LRU memo of recent texts"""
+
+    def __init__(self, cache_size=2):
+        # Cached streams keep their whole text alive, so the memo is small:
+        # it serves several metrics computed on the same text in a row
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def tokenize(self, text):
+        """Return the TokenStream for text, reusing it if seen recently"""
+        stream = self._cache.get(text)
+        if stream is not None:
+            self._cache.move_to_end(text)
+            return stream
+
+        stream = TokenStream(text)
+        if self.cache_size:
+            self._cache[text] = stream
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return stream
+
+    def clear_cache(self):
+        """Forget all memoized token streams"""
+        self._cache.clear()
+
+    def __str__(self):
+        """String representation of the tokenizer"""
+        return f"Tokenizer (cached: {len(self._cache)}/{self.cache_size} texts)"
+
+# Module testing
+if __name__ == "__main__":
+    print("Testing Tokenizer Module")
+    print("=" * 35)
+
+    tokenizer = Tokenizer()
+    stream = tokenizer.tokenize("Café costs 4 euros, room B12!")
+    print(stream)
+    for token in stream:
+        print(f"  {token}")
+    print(f"Words: {stream.words()}")
+    assert tokenizer.tokenize("Café costs 4 euros, room B12!") is stream
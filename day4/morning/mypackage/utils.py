@@ -5,52 +5,109 @@ Utils Module - Part of MyPackage
 This module provides quick utility functions for common tasks.
 """
 
+import os
 import random
+import re
 import string
 import hashlib
-from datetime import datetime, timedelta
-
-def quick_math(operation, *args):
-    """Quick math operations without creating a Calculator instance"""
-    operations = {
-        'add': lambda x, y: x + y,
-        'subtract': lambda x, y: x - y,
-        'multiply': lambda x, y: x * y,
-        'divide': lambda x, y: x / y if y != 0 else "Error: Division by zero",
-        'power': lambda x, y: x ** y,
-        'max': lambda *nums: max(nums),
-        'min': lambda *nums: min(nums),
-        'average': lambda *nums: sum(nums) / len(nums) if nums else 0
-    }
+from functools import lru_cache
+from itertools import islice, starmap
+from numbers import Real
+from datetime import datetime, timedelta, timezone
+
+class QuickOperationError(Exception):
+    """Base class for errors raised by quick_math/quick_text in strict mode"""
+
+class UnknownOperationError(QuickOperationError, ValueError):
+    """Raised in strict mode for an operation name that does not exist"""
+
+# Dispatch tables are built once at import time instead of on every call
+MATH_OPERATIONS = {
+    'add': lambda x, y: x + y,
+    'subtract': lambda x, y: x - y,
+    'multiply': lambda x, y: x * y,
+    'divide': lambda x, y: x / y if y != 0 else "Error: Division by zero",
+    'power': lambda x, y: x ** y,
+    'max': lambda *nums: max(nums),
+    'min': lambda *nums: min(nums),
+    'average': lambda *nums: sum(nums) / len(nums) if nums else 0
+}
+
+# Strict variants raise instead of returning error strings
+STRICT_MATH_OPERATIONS = dict(MATH_OPERATIONS, divide=lambda x, y: x / y)
+
+TEXT_OPERATIONS = {
+    'upper': lambda t: t.upper(),
+    'lower': lambda t: t.lower(),
+    'title': lambda t: t.title(),
+    'reverse': lambda t: t[::-1],
+    'length': lambda t: len(t),
+    'words': lambda t: len(t.split()),
+    'replace': lambda t, old, new: t.replace(old, new),
+    'startswith': lambda t, prefix: t.startswith(prefix),
+    'endswith': lambda t, suffix: t.endswith(suffix),
+    'contains': lambda t, substring: substring in t
+}
+
+def _lookup(table, operation, strict):
+    """Find an operation, raising or returning an error string if unknown"""
+    func = table.get(operation)
+    if func is None and strict:
+        raise UnknownOperationError(f"Unknown operation '{operation}'")
+    return func
+
+def quick_math(operation, *args, strict=False):
+    """Quick math operations without creating a Calculator instance
     
-    if operation not in operations:
+    By default errors are returned as strings; strict=True raises
+    UnknownOperationError or the underlying exception (e.g. ZeroDivisionError).
+    """
+    func = _lookup(STRICT_MATH_OPERATIONS if strict else MATH_OPERATIONS, operation, strict)
+    if func is None:
         return f"Error: Unknown operation '{operation}'"
-    
+    if strict:
+        return func(*args)
     try:
-        return operations[operation](*args)
+        return func(*args)
     except Exception as e:
         return f"Error: {str(e)}"
 
-def quick_text(operation, text, *args):
-    """Quick text operations without creating a TextProcessor instance"""
-    operations = {
-        'upper': lambda t: t.upper(),
-        'lower': lambda t: t.lower(),
-        'title': lambda t: t.title(),
-        'reverse': lambda t: t[::-1],
-        'length': lambda t: len(t),
-        'words': lambda t: len(t.split()),
-        'replace': lambda t, old, new: t.replace(old, new),
-        'startswith': lambda t, prefix: t.startswith(prefix),
-        'endswith': lambda t, suffix: t.endswith(suffix),
-        'contains': lambda t, substring: substring in t
-    }
+def quick_math_many(operation, pairs, strict=False):
+    """Apply one math operation to many argument tuples in a single call
     
-    if operation not in operations:
+    quick_math_many('add', [(1, 2), (3, 4)]) -> [3, 7]
+    Failures, including an unknown operation, are reported per item as
+    error strings unless strict=True.
+    """
+    func = _lookup(STRICT_MATH_OPERATIONS if strict else MATH_OPERATIONS, operation, strict)
+    pairs = pairs if isinstance(pairs, (list, tuple)) else list(pairs)
+    if func is None:
+        # Still one result per item, so callers can iterate as usual
+        return [f"Error: Unknown operation '{operation}'"] * len(pairs)
+    if strict:
+        return list(starmap(func, pairs))
+    try:
+        return list(starmap(func, pairs))
+    except Exception:
+        pass
+    # Slow path: report each failing item individually
+    results = []
+    for args in pairs:
+        try:
+            results.append(func(*args))
+        except Exception as e:
+            results.append(f"Error: {str(e)}")
+    return results
+
+def quick_text(operation, text, *args, strict=False):
+    """Quick text operations without creating a TextProcessor instance"""
+    func = _lookup(TEXT_OPERATIONS, operation, strict)
+    if func is None:
         return f"Error: Unknown operation '{operation}'"
-    
+    if strict:
+        return func(text, *args)
     try:
-        return operations[operation](text, *args)
+        return func(text, *args)
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -64,6 +121,70 @@ def generate_random_string(length=10, include_digits=True, include_special=False
     
     return ''.join(random.choice(chars) for _ in range(length))
 
+ID_ALPHABET = string.ascii_letters + string.digits
+
+# Translation tables per alphabet: (byte -> char table, rejected bytes)
+_alphabet_tables = {}
+
+def _alphabet_table(alphabet):
+    """Byte translation table mapping random bytes onto alphabet without bias
+    
+    Bytes at or above the largest multiple of len(alphabet) are rejected
+    (deleted), so every character is equally likely.
+    """
+    table = _alphabet_tables.get(alphabet)
+    if table is None:
+        if not alphabet or len(alphabet) > 256 or not alphabet.isascii():
+            raise ValueError("Alphabet must contain 1 to 256 ASCII characters")
+        if len(set(alphabet)) != len(alphabet):
+            raise ValueError("Alphabet characters must be unique")
+        size = len(alphabet)
+        limit = 256 - 256 % size
+        mapping = bytes(ord(alphabet[value % size]) if value < limit else 0 for value in range(256))
+        table = _alphabet_tables[alphabet] = (mapping, bytes(range(limit, 256)))
+    return table
+
+def _random_chars(count, alphabet):
+    """`count` cryptographically random characters from alphabet, as one str"""
+    mapping, rejected = _alphabet_table(alphabet)
+    chunks = []
+    produced = 0
+    while produced < count:
+        # Over-draw a little so one os.urandom call usually suffices
+        needed = count - produced
+        raw = os.urandom(needed + needed // 4 + 64)
+        chunk = raw.translate(mapping, rejected)
+        chunks.append(chunk)
+        produced += len(chunk)
+    return b''.join(chunks)[:count].decode('ascii')
+
+def generate_ids(n, length=16, alphabet=ID_ALPHABET, unique=True):
+    """Generate n random ids in bulk from os.urandom
+    
+    Random bytes are drawn in large blocks and mapped onto the alphabet
+    with rejection sampling (no modulo bias). With unique=True any
+    duplicates within the batch are replaced until all n ids differ.
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+    if unique and len(alphabet) ** length < n:
+        raise ValueError("Not enough distinct ids of this length for the batch")
+    block = _random_chars(n * length, alphabet)
+    ids = [block[i:i + length] for i in range(0, n * length, length)]
+    if unique:
+        # Drop duplicates (keeping order) and top up until there are n ids
+        ids = list(dict.fromkeys(ids))
+        seen = set(ids)
+        while len(ids) < n:
+            missing = n - len(ids)
+            extra = _random_chars(missing * length, alphabet)
+            for i in range(0, missing * length, length):
+                value = extra[i:i + length]
+                if value not in seen:
+                    seen.add(value)
+                    ids.append(value)
+    return ids
+
 def generate_password(length=12, include_uppercase=True, include_lowercase=True, 
                      include_digits=True, include_special=True):
     """Generate a secure password"""
@@ -80,24 +201,107 @@ def generate_password(length=12, include_uppercase=True, include_lowercase=True,
     if not chars:
         return "Error: No character types selected"
     
-    return ''.join(random.choice(chars) for _ in range(length))
+    return _random_chars(length, chars)
+
+# blake3 is optional; every other algorithm comes from hashlib
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+HASH_ALGORITHMS = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha512': hashlib.sha512,
+    'sha3_256': hashlib.sha3_256,
+    'blake2b': hashlib.blake2b,
+    'blake2s': hashlib.blake2s
+}
+if blake3 is not None:
+    HASH_ALGORITHMS['blake3'] = blake3.blake3
+
+def _new_hash(algorithm):
+    """Create a hash object, raising ValueError for unknown algorithms"""
+    if algorithm in HASH_ALGORITHMS:
+        return HASH_ALGORITHMS[algorithm]()
+    try:
+        return hashlib.new(algorithm)
+    except ValueError:
+        raise ValueError(f"Unknown algorithm '{algorithm}'") from None
 
 def hash_text(text, algorithm='sha256'):
     """Hash text using specified algorithm"""
-    algorithms = {
-        'md5': hashlib.md5,
-        'sha1': hashlib.sha1,
-        'sha256': hashlib.sha256,
-        'sha512': hashlib.sha512
-    }
-    
-    if algorithm not in algorithms:
+    if algorithm not in HASH_ALGORITHMS:
         return f"Error: Unknown algorithm '{algorithm}'"
     
-    hash_func = algorithms[algorithm]()
+    hash_func = HASH_ALGORITHMS[algorithm]()
     hash_func.update(text.encode('utf-8'))
     return hash_func.hexdigest()
 
+def hash_file(path, algorithm='sha256', chunk_size=1024 * 1024, use_mmap=False):
+    """Hash a file in fixed-size chunks without loading it into memory
+    
+    Chunks are read into one reused buffer and hashed through a memoryview,
+    so no per-chunk bytes objects are created. use_mmap=True hashes
+    straight from a memory map instead. Raises ValueError for unknown
+    algorithms.
+    """
+    hash_func = _new_hash(algorithm)
+    with open(path, 'rb') as file:
+        if use_mmap:
+            import mmap  # imported lazily to keep `import mypackage.utils` fast
+            size = os.fstat(file.fileno()).st_size
+            if size:
+                # Views are released even if update() raises, so closing the
+                # map cannot fail with BufferError and hide that error
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as view:
+                    for start in range(0, size, chunk_size):
+                        with view[start:start + chunk_size] as chunk:
+                            hash_func.update(chunk)
+            return hash_func.hexdigest()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            read = file.readinto(buffer)
+            if not read:
+                break
+            hash_func.update(view[:read])
+    return hash_func.hexdigest()
+
+def hash_stream(chunks, algorithm='sha256', encoding='utf-8'):
+    """Hash an iterable of bytes-like or str chunks incrementally"""
+    hash_func = _new_hash(algorithm)
+    for chunk in chunks:
+        hash_func.update(chunk.encode(encoding) if isinstance(chunk, str) else chunk)
+    return hash_func.hexdigest()
+
+def hash_many(paths, algorithm='sha256', workers=8, chunk_size=1024 * 1024):
+    """Hash many files on a thread pool (hashlib releases the GIL)
+    
+    Returns {'results': {path: digest}, 'errors': {path: exception}}.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # lazy, see hash_file
+    _new_hash(algorithm)
+    paths = list(paths)
+    results = {}
+    errors = {}
+    
+    def job(path):
+        try:
+            return path, hash_file(path, algorithm, chunk_size), None
+        except OSError as e:
+            return path, None, e
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, digest, error in pool.map(job, paths):
+            if error is None:
+                results[path] = digest
+            else:
+                errors[path] = error
+    return {'results': results, 'errors': errors}
+
 def format_bytes(bytes_count):
     """Format bytes into human-readable format"""
     units = ['B', 'KB', 'MB', 'GB', 'TB']
@@ -156,25 +360,139 @@ def days_between(date1_str, date2_str):
     except ValueError:
         return "Error: Invalid date format"
 
+@lru_cache(maxsize=65536)
+def _parse_iso(date_str):
+    """Parse an ISO date string once; None if it is invalid"""
+    try:
+        return datetime.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        return None
+
+def _require_numpy():
+    """Import numpy for the as_array variants, with a clear error if missing"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("as_array=True requires numpy (pip install numpy)") from None
+    return numpy
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _to_datetime64(numpy, parsed):
+    """datetime64[us] array and invalid mask; aware datetimes are converted to UTC"""
+    # Converting each distinct datetime to epoch microseconds once is far
+    # faster than letting numpy convert a list of datetime objects
+    micros = {None: 0}
+    values = []
+    for value in parsed:
+        micro = micros.get(value)
+        if micro is None:
+            epoch = _EPOCH_UTC if value.tzinfo else _EPOCH
+            micro = micros[value] = (value - epoch) // _MICROSECOND
+        values.append(micro)
+    mask = numpy.array([value is None for value in parsed], dtype=bool)
+    return numpy.array(values, dtype='int64').view('datetime64[us]'), mask
+
+def _check_lengths(first, second, what):
+    """Batch inputs must pair up exactly, in list and array mode alike"""
+    if len(first) != len(second):
+        raise ValueError(f"{what} have different lengths: {len(first)} and {len(second)}")
+
+def add_days_many(date_strs, days, as_array=False):
+    """Add days to many ISO date strings at once
+    
+    days is a single number or one number per date (ValueError if the
+    lengths differ). Each distinct string is parsed only once (results are
+    cached across calls). Invalid dates give None instead of an error
+    string. With as_array=True the result is a numpy masked datetime64
+    array computed with vectorized arithmetic; datetime64 has no time
+    zone, so aware dates come back converted to UTC.
+    """
+    date_strs = list(date_strs)
+    parsed = [_parse_iso(value) for value in date_strs]
+    if isinstance(days, Real):
+        offsets = [days] * len(parsed)
+    else:
+        offsets = list(days)
+        _check_lengths(date_strs, offsets, "dates and days")
+    if as_array:
+        numpy = _require_numpy()
+        dates, mask = _to_datetime64(numpy, parsed)
+        microseconds = (numpy.asarray(offsets, dtype=float) * 86400e6).astype('int64')
+        result = dates + microseconds.astype('timedelta64[us]')
+        return numpy.ma.masked_array(result, mask=mask)
+    
+    # Repeated (date, offset) pairs are common in real batches, so each
+    # distinct pair is shifted and formatted only once
+    shifted = {}
+    results = []
+    for text, value, offset in zip(date_strs, parsed, offsets):
+        if value is None:
+            results.append(None)
+            continue
+        key = (text, offset)
+        result = shifted.get(key)
+        if result is None:
+            # float() also accepts numpy scalars, which timedelta rejects
+            result = shifted[key] = (value + timedelta(days=float(offset))).isoformat()
+        results.append(result)
+    return results
+
+def days_between_many(start_strs, end_strs, as_array=False):
+    """Whole days from each start date to the matching end date
+    
+    The inputs must have the same length (ValueError otherwise). Invalid
+    dates, and pairs mixing a naive and an aware date, give None (or are
+    masked with as_array=True, which returns a numpy masked int64 array).
+    """
+    starts = [_parse_iso(value) for value in start_strs]
+    ends = [_parse_iso(value) for value in end_strs]
+    _check_lengths(starts, ends, "start and end dates")
+    if as_array:
+        numpy = _require_numpy()
+        start_values, start_mask = _to_datetime64(numpy, starts)
+        end_values, end_mask = _to_datetime64(numpy, ends)
+        mixed = numpy.array([
+            start is not None and end is not None and (start.tzinfo is None) != (end.tzinfo is None)
+            for start, end in zip(starts, ends)
+        ], dtype=bool)
+        microseconds = (end_values - start_values).astype('int64')
+        # Floor division matches timedelta.days for negative differences
+        return numpy.ma.masked_array(microseconds // 86400000000,
+                                     mask=start_mask | end_mask | mixed)
+    
+    results = []
+    for start, end in zip(starts, ends):
+        try:
+            results.append((end - start).days)
+        except TypeError:
+            # Missing value, or naive and aware datetimes mixed
+            results.append(None)
+    return results
+
+# Validation patterns, compiled once at import time
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+URL_PATTERN = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+NON_DIGIT = re.compile(r'\D')
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
 def validate_email(email):
     """Simple email validation"""
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 def validate_phone(phone):
     """Simple phone number validation"""
-    import re
     # Remove all non-digits
-    digits = re.sub(r'\D', '', phone)
+    digits = NON_DIGIT.sub('', phone)
     # Check if it's a valid length (10 or 11 digits)
     return len(digits) in [10, 11]
 
 def clean_filename(filename):
     """Clean filename by removing invalid characters"""
-    import re
     # Remove invalid characters
-    cleaned = re.sub(r'[<>:"/\\|?*]', '', filename)
+    cleaned = INVALID_FILENAME_CHARS.sub('', filename)
     # Remove leading/trailing spaces and dots
     cleaned = cleaned.strip(' .')
     return cleaned
@@ -186,9 +504,67 @@ def get_file_extension(filename):
 
 def is_valid_url(url):
     """Simple URL validation"""
-    import re
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url))
+    return bool(URL_PATTERN.match(url))
+
+# Rule names accepted by validate_many. Each check takes a str and returns
+# something truthy when it is valid; the regex rules use the compiled
+# pattern's match method directly to skip a function call per value.
+VALIDATORS = {
+    'email': EMAIL_PATTERN.match,
+    'phone': validate_phone,
+    'url': URL_PATTERN.match,
+}
+
+def _resolve_rules(rules):
+    """Map each field to its check, looking up rule names in VALIDATORS"""
+    resolved = {}
+    for field, rule in rules.items():
+        if callable(rule):
+            resolved[field] = rule
+        elif rule in VALIDATORS:
+            resolved[field] = VALIDATORS[rule]
+        else:
+            raise ValueError(f"Unknown validation rule '{rule}' for field '{field}'")
+    return resolved
+
+def _validate_chunk(records, rules):
+    """Boolean mask per field for one chunk of records"""
+    masks = {}
+    for field, check in _resolve_rules(rules).items():
+        values = [record.get(field) for record in records]
+        try:
+            masks[field] = list(map(bool, map(check, values)))
+        except TypeError:
+            # Missing fields and non-string values are invalid
+            masks[field] = [isinstance(value, str) and bool(check(value)) for value in values]
+    return masks
+
+def validate_many(records, rules, workers=None, chunk_size=100000):
+    """Validate many records (dicts) against per-field rules
+    
+    rules maps a field name to a rule name from VALIDATORS ('email',
+    'phone', 'url') or to a callable taking a string. Returns
+    {'masks': {field: [bool, ...]}, 'valid': [bool, ...], 'invalid': count},
+    where 'valid' is True for records that pass every rule.
+    With workers > 1, batches larger than chunk_size are split across a
+    process pool; callables must then be picklable (module-level).
+    """
+    records = list(records)
+    _resolve_rules(rules)
+    if workers and workers > 1 and len(records) > chunk_size:
+        from concurrent.futures import ProcessPoolExecutor  # lazy, see hash_file
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk_masks = list(pool.map(_validate_chunk, chunks, [rules] * len(chunks)))
+        masks = {field: [] for field in rules}
+        for chunk_mask in chunk_masks:
+            for field, mask in chunk_mask.items():
+                masks[field].extend(mask)
+    else:
+        masks = _validate_chunk(records, rules)
+    
+    valid = list(map(all, zip(*masks.values()))) if masks else [True] * len(records)
+    return {'masks': masks, 'valid': valid, 'invalid': valid.count(False)}
 
 def truncate_middle(text, max_length, separator='...'):
     """Truncate text in the middle, keeping start and end"""
@@ -205,19 +581,67 @@ def truncate_middle(text, max_length, separator='...'):
     
     return text[:start_length] + separator + text[-end_length:]
 
+# Sequence types known to support slice indexing; other iterables (deque,
+# generators, custom sequences) are chunked with islice
+SLICEABLE_TYPES = (list, tuple, str, bytes, bytearray, range, memoryview)
+
+def iter_chunks(iterable, chunk_size):
+    """Yield successive chunks of chunk_size items from any iterable
+    
+    Sliceable sequences (see SLICEABLE_TYPES) yield slices of the same
+    type; other iterables, including unbounded generators, are consumed
+    lazily and yield lists.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(iterable, SLICEABLE_TYPES):
+        for start in range(0, len(iterable), chunk_size):
+            yield iterable[start:start + chunk_size]
+        return
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_memory_chunks(data, chunk_size):
+    """Yield zero-copy memoryview chunks of bytes, bytearray, array or mmap
+    
+    chunk_size counts items of the buffer (bytes, or array elements).
+    The views keep data alive; release them before resizing a bytearray.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
 def chunk_list(lst, chunk_size):
     """Split a list into chunks of specified size"""
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    return list(iter_chunks(lst, chunk_size))
+
+def iter_flatten(nested, types=(list,)):
+    """Yield the leaves of arbitrarily deep nesting without recursion
+    
+    Only instances of `types` are expanded (lists by default, as in
+    flatten_list); pass e.g. (list, tuple) to expand more. An explicit
+    stack of iterators replaces recursion, so depth is limited only by
+    memory.
+    """
+    stack = [iter(nested)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, types):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
 
 def flatten_list(nested_list):
     """Flatten a nested list"""
-    flattened = []
-    for item in nested_list:
-        if isinstance(item, list):
-            flattened.extend(flatten_list(item))
-        else:
-            flattened.append(item)
-    return flattened
+    return list(iter_flatten(nested_list))
 
 def remove_duplicates(lst):
     """Remove duplicates from a list while preserving order"""
@@ -240,7 +664,7 @@ def get_random_sample(population, k):
 # Convenience functions that combine multiple operations
 def create_secure_id(length=16):
     """Create a secure random ID"""
-    return generate_random_string(length, include_digits=True, include_special=False)
+    return _random_chars(length, ID_ALPHABET)
 
 def format_file_size(filename):
     """Get formatted file size"""